@@ -0,0 +1,55 @@
+"""Offline benchmarks, run with ``python -m benchmarks.<name>`` from the repository root."""
+
+from __future__ import annotations
+
+import random
+
+from tests.fakes import build_feed
+
+def fake_value(name: str, prop: dict, row: int) -> str | tuple[str, str] | None:
+    """Return a plausible value of a schema property.
+
+    Args:
+        name: The property name.
+        prop: The property schema.
+        row: The row number.
+
+    Returns:
+        A text, a ``(text, m:type)`` pair, or None for a null.
+    """
+    types = prop.get("type", "string")
+    json_type = types if isinstance(types, str) else next(t for t in types if t != "null")
+    if row % 7 == 0 and name not in ("ID", "Division", "Timestamp"):
+        return None
+    if prop.get("format") == "date-time":
+        if name in ("Created", "Modified"):
+            return (f"2024-03-{row % 28 + 1:02d}T10:{row % 60:02d}:12.347", "Edm.DateTime")
+        return (f"2024-03-{row % 28 + 1:02d}T00:00:00", "Edm.DateTime")
+    if name == "Timestamp":
+        return (str(1_000_000 + row), "Edm.Int64")
+    if json_type == "integer":
+        return (str(random.randint(0, 100_000)), "Edm.Int32")
+    if json_type == "number":
+        return (f"{random.uniform(-1e5, 1e5):.2f}", "Edm.Double")
+    if json_type == "boolean":
+        return (random.choice(("true", "false")), "Edm.Boolean")
+    return f"{name}-{row}-{random.randint(0, 1 << 32):08x}"
+
+
+def fake_page(schema: dict, rows: int, seed: int = 0) -> bytes:
+    """Build a page of rows with every property of a stream schema.
+
+    Args:
+        schema: The stream schema.
+        rows: Number of entries.
+        seed: Random seed, for reproducible pages.
+
+    Returns:
+        The feed XML.
+    """
+    random.seed(seed)
+    properties = [
+        (name, prop) for name, prop in schema["properties"].items() if not name.startswith("_sdc_")
+    ]
+    entries = [{name: fake_value(name, prop, row) for name, prop in properties} for row in range(rows)]
+    return build_feed(entries)
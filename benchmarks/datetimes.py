@@ -0,0 +1,65 @@
+"""Compare the time of normalizing Exact date-times with pendulum and fromisoformat.
+
+``datetime.fromisoformat`` is only a reference: before Python 3.11 it rejects
+the 7-digit fractions Exact sometimes emits, and it leaves naive values naive
+instead of reading them in the source time zone.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from pendulum import parse
+
+from tap_exact.odata import DEFAULT_TIMEZONE, _parse_date, _utc_offset, parse_datetime
+
+VALUES = 100_000
+
+
+def dates(count: int) -> list[str]:
+    # dates like Date and DueDate, a few hundred distinct days
+    start = datetime(2020, 1, 1)
+    return [
+        (start + timedelta(days=random.randrange(730))).strftime("%Y-%m-%dT00:00:00")
+        for _ in range(count)
+    ]
+
+
+def timestamps(count: int) -> list[str]:
+    start = datetime(2020, 1, 1)
+    return [
+        (start + timedelta(seconds=random.randrange(10**8))).strftime("%Y-%m-%dT%H:%M:%S")
+        + f".{random.randrange(1000):03}"
+        for _ in range(count)
+    ]
+
+
+def measure(convert, values: list[str]) -> float:
+    _parse_date.cache_clear()
+    _utc_offset.cache_clear()
+    started = time.perf_counter()
+    for value in values:
+        convert(value)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    random.seed(0)
+    parsers = {
+        "pendulum": lambda text: parse(text, tz=DEFAULT_TIMEZONE).isoformat(),
+        "fromisoformat": lambda text: datetime.fromisoformat(text).isoformat(),
+        "parse_datetime": parse_datetime,
+    }
+
+    print(f"{'values':>11} {'pendulum s':>11} {'fromisoformat s':>16} {'parse_datetime s':>17}")
+    for name, values in (("date-only", dates(VALUES)), ("timestamps", timestamps(VALUES))):
+        pendulum_time, iso_time, parse_time = (
+            measure(convert, values) for convert in parsers.values()
+        )
+        print(f"{name:>11} {pendulum_time:>11.3f} {iso_time:>16.3f} {parse_time:>17.3f}")
+
+
+if __name__ == "__main__":
+    main()
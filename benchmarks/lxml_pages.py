@@ -0,0 +1,47 @@
+"""Compare decoding pages through xmltodict and from the lxml tree.
+
+Measured on TransactionLines and SalesInvoices pages.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from benchmarks import fake_page
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, build_response
+
+PAGES = 20
+ROWS = 1000
+
+
+def decode(stream, pages: list[bytes]) -> float:
+    started = time.perf_counter()
+    for body in pages:
+        response = build_response(body)
+        stream.validate_response(response)
+        for row in stream.parse_response(response):
+            stream.post_process(row)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    row_tap = TapExact(config=CONFIG, parse_env_config=False)
+    lxml_tap = TapExact(config={**CONFIG, "lxml_pages": True}, parse_env_config=False)
+
+    print(f"{'stream':<18} {'rows':>6} {'xmltodict s':>12} {'lxml s':>7} {'speedup':>8}")
+    for name in ("transaction_lines", "sales_invoices"):
+        schema = row_tap.streams[name].schema
+        pages = [fake_page(schema, ROWS, seed) for seed in range(PAGES)]
+        row_time = decode(row_tap.streams[name], pages)
+        lxml_time = decode(lxml_tap.streams[name], pages)
+        print(
+            f"{name:<18} {PAGES * ROWS:>6} {row_time:>12.2f} {lxml_time:>7.2f} "
+            f"{row_time / lxml_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare peak memory and time of buffered and streamed page parsing.
+
+Python allocations are measured with tracemalloc, which also slows both paths
+down. lxml's own buffers are not Python allocations, so the streamed figures
+leave out the one entry libxml2 holds at a time. The streamed peak includes the
+in-memory part of the spool, bounded by ``max_buffer_size``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import tracemalloc
+
+from benchmarks import fake_page
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, build_response
+
+
+def measure(stream, body: bytes) -> tuple[float, float]:
+    response = build_response(body)
+    tracemalloc.start()
+    started = time.perf_counter()
+    stream.validate_response(response)
+    for row in stream.parse_response(response):
+        stream.post_process(row)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024, elapsed
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    buffered = TapExact(config=CONFIG, parse_env_config=False).streams["transaction_lines"]
+    streamed = TapExact(
+        config={**CONFIG, "stream_responses": True}, parse_env_config=False
+    ).streams["transaction_lines"]
+
+    print(f"{'rows':>6} {'page MiB':>9} {'buffered MiB':>13} {'streamed MiB':>13} {'buffered s':>11} {'streamed s':>11}")
+    for rows in (60, 1000, 5000):
+        body = fake_page(buffered.schema, rows)
+        buffered_peak, buffered_time = measure(buffered, body)
+        streamed_peak, streamed_time = measure(streamed, body)
+        print(
+            f"{rows:>6} {len(body) / 1024 / 1024:>9.1f} {buffered_peak:>13.1f} "
+            f"{streamed_peak:>13.1f} {buffered_time:>11.2f} {streamed_time:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import backoff
 import os
+import threading
 import json
 import requests
 import pendulum
@@ -40,6 +41,7 @@ class ExactAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
         self.refresh_token = tokens["refresh_token"]
         self.last_refreshed = pendulum.parse(tokens["last_refreshed"])
         self.expires_in = 600
+        self._refresh_lock = threading.Lock()
         
     @cached_property
     def azure_client(self):
@@ -83,10 +85,20 @@ class ExactAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
             "grant_type": "refresh_token",
         }
 
+    def invalidate_access_token(self) -> None:
+        """Force a token refresh on the next authenticated request."""
+        self.last_refreshed = None
+
     @backoff.on_exception(backoff.expo, EmptyResponseError, max_tries=5, factor=2)
     def update_access_token(self) -> None:
         """Update the access token."""
+        # Streams synced concurrently share this authenticator, and Exact rotates
+        # the refresh token, so only one of them may refresh it.
+        with self._refresh_lock:
+            if not self.is_token_valid():
+                self._refresh_access_token()
 
+    def _refresh_access_token(self) -> None:
         # Get the current time to calculate the token expiration
         request_time = utc_now()
 
@@ -108,10 +120,20 @@ class ExactAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
             msg = f"Failed OAuth login, response was '{token_response.json()}'. {ex}"
             raise RuntimeError(msg) from ex
 
+        if not token_response.content:
+            raise EmptyResponseError("Empty response from the OAuth endpoint.")
+
         self.logger.info("OAuth authorization attempt was successful.")
 
-        token_json = token_response.json()
+        self.store_access_token(token_response.json(), request_time)
+
+    def store_access_token(self, token_json: dict, request_time) -> None:
+        """Apply a successful OAuth response and persist the new tokens.
 
+        Args:
+            token_json: The OAuth response body.
+            request_time: When the token was requested.
+        """
         self.access_token = token_json["access_token"]
         self.refresh_token = token_json["refresh_token"]
 
@@ -0,0 +1,197 @@
+"""On-disk HTTP response cache for development and replay runs."""
+
+from __future__ import annotations
+
+import io
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class CacheMissError(Exception):
+    """Raised in replay mode when a request is not in the cache."""
+
+
+class ResponseCache:
+    """SQLite store of compressed response bodies keyed by request URL.
+
+    The URL holds the division, ``$select``, ``$filter`` and ``$skiptoken``, so
+    it identifies a page. Entries expire after ``ttl`` seconds and the least
+    recently used ones are evicted once the bodies exceed ``max_size`` bytes.
+    """
+
+    def __init__(self, directory: str, ttl: int, max_size: int) -> None:
+        """Init response cache.
+
+        Args:
+            directory: Directory where the cache database is stored.
+            ttl: Seconds a cached response is served outside of replay mode.
+            max_size: Maximum compressed size of the cached bodies, in bytes.
+        """
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            Path(directory) / "responses.sqlite", timeout=30, check_same_thread=False
+        )
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+            """
+        )
+        self.connection.commit()
+
+    def get(self, url: str, ignore_ttl: bool = False) -> tuple[int, dict, bytes] | None:
+        """Return a cached response.
+
+        Args:
+            url: The full request URL.
+            ignore_ttl: Serve the response even if it expired.
+
+        Returns:
+            The status code, headers and body, or None if not cached.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT status, headers, body, created FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            status, headers, body, created = row
+            now = time.time()
+            if not ignore_ttl and now - created > self.ttl:
+                return None
+            self.connection.execute(
+                "UPDATE responses SET accessed = ? WHERE url = ?", (now, url)
+            )
+            self.connection.commit()
+        return status, json.loads(headers), zlib.decompress(body)
+
+    def set(self, url: str, status: int, headers: dict, body: bytes) -> None:
+        """Store a response and evict the least recently used ones over the size limit.
+
+        Args:
+            url: The full request URL.
+            status: The response status code.
+            headers: The response headers.
+            body: The uncompressed response body.
+        """
+        now = time.time()
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (url, status, json.dumps(headers), zlib.compress(body), now, now),
+            )
+            (size,) = self.connection.execute(
+                "SELECT COALESCE(SUM(LENGTH(body)), 0) FROM responses"
+            ).fetchone()
+            while size > self.max_size:
+                row = self.connection.execute(
+                    "SELECT url, LENGTH(body) FROM responses ORDER BY accessed LIMIT 1"
+                ).fetchone()
+                if row is None or row[0] == url:
+                    break
+                self.connection.execute("DELETE FROM responses WHERE url = ?", (row[0],))
+                size -= row[1]
+            self.connection.commit()
+
+    def delete(self, url: str) -> None:
+        """Remove a cached response.
+
+        Args:
+            url: The full request URL.
+        """
+        with self._lock:
+            self.connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self.connection.commit()
+
+
+class CachingAdapter(HTTPAdapter):
+    """Transport adapter that serves and records responses through a ResponseCache.
+
+    Modes:
+        cache: serve unexpired responses, fetch and store the rest.
+        record: always fetch, and store every successful response.
+        replay: only serve cached responses, regardless of their age.
+
+    Responses are not stored when they are received, but by the stream through
+    :meth:`store` once they passed validation, so an invalid page is never
+    cached.
+    """
+
+    def __init__(self, cache: ResponseCache, mode: str = "cache") -> None:
+        super().__init__()
+        self.cache = cache
+        self.mode = mode
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.mode != "record":
+            cached = self.cache.get(request.url, ignore_ttl=self.mode == "replay")
+            if cached:
+                return self.build_cached_response(request, *cached)
+            if self.mode == "replay":
+                msg = f"No cached response for {request.url}"
+                raise CacheMissError(msg)
+
+        response = super().send(request, **kwargs)
+        response.from_cache = False
+        return response
+
+    def store(self, response: requests.Response) -> None:
+        """Store a fetched response that passed validation.
+
+        Args:
+            response: The validated response.
+        """
+        if self.mode == "replay" or response.from_cache or not response.ok:
+            return
+        # rate limits belong to the original run, not to a replay
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if not key.lower().startswith("x-ratelimit")
+        }
+        self.cache.set(response.request.url, response.status_code, headers, response.content)
+
+    def evict(self, response: requests.Response) -> None:
+        """Drop a cached response that failed validation, so its retry is fetched again.
+
+        Args:
+            response: The invalid response.
+        """
+        if response.from_cache:
+            self.cache.delete(response.request.url)
+
+    def build_cached_response(
+        self,
+        request: requests.PreparedRequest,
+        status: int,
+        headers: dict,
+        body: bytes,
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(headers)
+        response.raw = io.BytesIO(body)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        return response
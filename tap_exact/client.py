@@ -9,17 +9,29 @@ import typing
 from datetime import datetime
 import time
 import logging
+import re
+import enum
+import tempfile
+from http import HTTPStatus
 
+import backoff
 import requests
+from singer_sdk import metrics
+from singer_sdk.exceptions import RetriableAPIError
+from singer_sdk.helpers._state import get_state_if_exists
 from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import BaseOffsetPaginator  # noqa: TCH002
 from singer_sdk.streams import RESTStream
 from lxml import etree
-import json
 import xmltodict
 from pendulum import parse
 
 from tap_exact.auth import ExactAuthenticator
+from tap_exact.cache import CachingAdapter, ResponseCache
+from tap_exact.entries import ATOM, decode_entries
+from tap_exact.fingerprints import FingerprintIndex
+from tap_exact.odata import DEFAULT_TIMEZONE, edm_converters
+from tap_exact.progress import ProgressTracker
 
 if typing.TYPE_CHECKING:
     from requests import Response
@@ -34,6 +46,43 @@ else:
 _Auth = Callable[[requests.PreparedRequest], requests.PreparedRequest]
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
+ENTRY_START = re.compile(rb"<entry[\s>]")
+ENTRY_END = b"</entry>"
+ENTRY_TAG = re.compile(rb"<(/?)entry[\s>]")
+CHUNK_SIZE = 64 * 1024
+# $count answers of endpoints that do not support counting, as opposed to failures
+UNSUPPORTED_COUNT_STATUSES = (
+    HTTPStatus.BAD_REQUEST,
+    HTTPStatus.NOT_FOUND,
+    HTTPStatus.NOT_IMPLEMENTED,
+)
+
+
+class InvalidPageError(RetriableAPIError):
+    """Raised when a page is truncated or its entries do not parse completely."""
+
+
+class ExactMetric(str, enum.Enum):
+    """Metrics emitted by the Exact streams on top of the SDK ones."""
+
+    HTTP_RETRY_COUNT = "http_retry_count"
+
+
+def rate_limit_wait(response: Response) -> float:
+    """Return the seconds until the minutely rate limit of a response resets.
+
+    Args:
+        response: API response object.
+
+    Returns:
+        The seconds to wait, or 0 when requests are still remaining.
+    """
+    if response.headers.get("X-RateLimit-Minutely-Remaining") != "0":
+        return 0
+    reset_timestamp = int(response.headers["X-RateLimit-Minutely-Reset"])
+    current_timestamp = time.time() * 1000
+    return max((reset_timestamp - current_timestamp) / 1000, 0)
+
 
 class ExactPaginator(BaseOffsetPaginator):
     def __init__(self, stream, start_value, page_size) -> None:
@@ -49,19 +98,15 @@ class ExactPaginator(BaseOffsetPaginator):
         Returns:
             Boolean flag used to indicate if the endpoint has more pages.
         """
-        data = self.stream.xml_to_dict(response)
-
-        if response.headers["X-RateLimit-Minutely-Remaining"] == "0":
+        time_to_wait_in_sec = rate_limit_wait(response)
+        if time_to_wait_in_sec:
             logging.info("Reached rate limit. Sleeping...")
-            reset_timestamp = int(response.headers["X-RateLimit-Minutely-Reset"])
-            current_timestamp = time.time() * 1000
-            time_to_wait_in_sec = (reset_timestamp - current_timestamp) / 1000
             logging.info(f"Sleeping for {time_to_wait_in_sec}")
             time.sleep(time_to_wait_in_sec)
 
-        link = data.get("feed", {}).get("link", [])
-        if type(link) == list:
-            return "next" in [item.get("@rel", "") for item in link]
+        if self.stream.get_next_link(response) is None:
+            return False
+        return self.stream.has_quota_for_next_page(response)
 
     def get_next(self, response: Response) -> TPageToken | None:
         """Get the next pagination token or index from the API response.
@@ -73,10 +118,8 @@ class ExactPaginator(BaseOffsetPaginator):
             The next page token or index. Return `None` from this method to indicate
                 the end of pagination.
         """
-        data = self.stream.xml_to_dict(response)
-        link = data.get("feed", {}).get("link", [])
-        if "next" in [item.get("@rel", "") for item in link]:
-            next_link = [item["@href"] for item in link if item["@rel"] == "next"][0]
+        next_link = self.stream.get_next_link(response)
+        if next_link:
             next_page_token = next_link.split("&")[-1].split("=")[-1]
             return next_page_token
 
@@ -84,6 +127,300 @@ class ExactPaginator(BaseOffsetPaginator):
 class ExactStream(RESTStream):
     """Exact stream class."""
 
+    # Rough thousands of rows per division, to schedule large streams first
+    # when no row count is available.
+    relative_size = 1
+    # Whether a sync may stop after any page and resume from the bookmark.
+    resumable = False
+    # Whether the endpoint answers $count, turned off once it answers unsupported.
+    supports_count = True
+    page_size = 60
+    # Property a repair slices the stream on.
+    repair_key = "Modified"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._row_counts: dict[str, int | None] = {}
+        self._admitted: dict[str, bool] = {}
+        if self.fingerprints:
+            properties = dict(self.schema["properties"])
+            properties["_sdc_deleted_at"] = {"type": ["string", "null"], "format": "date-time"}
+            self.schema = {**self.schema, "properties": properties}
+
+        self.requests_session.stream = self.config.get("stream_responses", False)
+        self.response_cache: CachingAdapter | None = None
+        self.count_session = self.requests_session
+        if self.config.get("response_cache_dir") and self.requests_session.stream:
+            # the cache stores whole bodies, which defeats streaming them
+            self.logger.warning(
+                "The response cache does not support streamed responses, not using it."
+            )
+        elif self.config.get("response_cache_dir"):
+            cache = ResponseCache(
+                self.config["response_cache_dir"],
+                ttl=self.config.get("response_cache_ttl", 86400),
+                max_size=self.config.get("response_cache_max_size", 1024**3),
+            )
+            mode = self.config.get("response_cache_mode", "cache")
+            self.response_cache = CachingAdapter(cache, mode)
+            self.requests_session.mount(self.url_base, self.response_cache)
+            # row counts change with every sync, so they are never served from the cache
+            self.count_session = requests.Session()
+
+    @cached_property
+    def fingerprints(self) -> FingerprintIndex | None:
+        """Return the fingerprint index of a full-reload stream, if enabled.
+
+        Returns:
+            A fingerprint index, or None for incremental streams.
+        """
+        fingerprint_dir = self.config.get("fingerprint_dir")
+        if not fingerprint_dir or self.replication_key:
+            return None
+        return FingerprintIndex(fingerprint_dir, self.name, self.primary_keys)
+
+    @cached_property
+    def edm_converters(self) -> dict[str, Callable[[str], Any]]:
+        """Return the converters of Edm values, for the configured source time zone.
+
+        Returns:
+            The converter of each ``m:type``.
+        """
+        return edm_converters(self.config.get("source_timezone", DEFAULT_TIMEZONE))
+
+    def division_of(self, response: Response) -> str:
+        """Return the division a response belongs to, from its URL.
+
+        Args:
+            response: API response object.
+
+        Returns:
+            The Exact division.
+        """
+        return response.url[len(self.url_base) + 1:].split("/")[0]
+
+    def has_quota_for_next_page(self, response: Response) -> bool:
+        """Tell whether the daily quota allows fetching the page after this one.
+
+        Only resumable streams stop at a page boundary. Other streams were only
+        started if the quota allowed all their pages, and stopping them halfway
+        would lose the rest of a full reload. A repair never stops either: it
+        writes no bookmark to resume from, and was asked for explicitly.
+
+        Args:
+            response: API response object.
+
+        Returns:
+            False if the stream should stop at this page.
+        """
+        if not self.resumable or self.config.get("repair"):
+            return True
+        division = self.division_of(response)
+        if self._tap.quota_planner.allows_next_page(self.name, division):
+            return True
+        self.logger.warning(
+            "Daily request quota reached for division %s, stopping '%s' after this "
+            "page. It resumes from its bookmark on the next run.",
+            division,
+            self.name,
+        )
+        return False
+
+    def estimate_size(self) -> int:
+        """Estimate the rows of the stream, used to schedule large streams first.
+
+        Returns:
+            The pre-flight row counts if available, otherwise a rough estimate.
+        """
+        counts = [self.row_count(context) for context in self.partitions]
+        if all(count is not None for count in counts):
+            return sum(counts)
+        return self.relative_size * 1000 * len(self.partitions)
+
+    def row_count(self, context: dict) -> int | None:
+        """Return the rows a partition will sync, from a pre-flight ``$count`` request.
+
+        The count is only requested if ``preflight_counts`` is enabled, the
+        endpoint supports it and the daily quota allows it, and is cached for
+        the run. It is always requested from the API, never from the response
+        cache, so no count is available when replaying the cache.
+
+        Failed requests are retried like page requests. Counts are turned off for
+        the rest of the run only if the endpoint answers that it does not support
+        them, otherwise only this partition goes without a count.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            The row count, or None if not available.
+        """
+        division = context["division"]
+        if division in self._row_counts:
+            return self._row_counts[division]
+        if not self.config.get("preflight_counts", False) or not self.supports_count:
+            return None
+        if self.response_cache is not None and self.response_cache.mode == "replay":
+            return None
+        if not self._tap.quota_planner.allows_partition(self.name, division, False, needed=1):
+            return None
+
+        params = self.get_url_params(context, None)
+        params.pop("$select", None)
+        request = self.build_prepared_request(
+            method="GET",
+            url=f"{self.get_url(context)}/$count",
+            params=params,
+            headers=self.http_headers,
+        )
+        try:
+            response = self.request_decorator(self._send_count)(request, context)
+            if response.status_code in UNSUPPORTED_COUNT_STATUSES:
+                self.logger.info(
+                    "Row counts are not supported for '%s': %s",
+                    self.name,
+                    self.response_error_message(response),
+                )
+                self.supports_count = False
+                return None
+            response.raise_for_status()
+            count = int(response.text.strip())
+        except (requests.RequestException, RetriableAPIError, ValueError) as ex:
+            # a failed count only costs this partition its progress and planning
+            self.logger.info(
+                "Row count of '%s' is not available for division %s: %s",
+                self.name,
+                division,
+                ex,
+            )
+            count = None
+
+        self._row_counts[division] = count
+        return count
+
+    def _send_count(self, request: requests.PreparedRequest, context: dict) -> requests.Response:
+        # retried by request_decorator, whose backoff handler re-authenticates
+        self._tap.rate_budget.acquire()
+        response = self.count_session.send(request, timeout=self.timeout)
+        self._tap.rate_budget.update(response)
+        self._tap.quota_planner.update(self.name, context["division"], response)
+        if response.status_code in UNSUPPORTED_COUNT_STATUSES:
+            return response
+        if response.status_code == HTTPStatus.UNAUTHORIZED and self.authenticator:
+            self.authenticator.invalidate_access_token()
+        if (
+            response.status_code == HTTPStatus.UNAUTHORIZED
+            or response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+            or response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+        ):
+            raise RetriableAPIError(self.response_error_message(response), response)
+        return response
+
+    def admit(self, context: dict) -> bool:
+        """Decide, once per run, whether a partition fits the daily quota.
+
+        The async engine decides before it prefetches a partition, and the sync
+        follows the same decision, so a partition is never fetched and then
+        skipped.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            True if the partition may be synced.
+        """
+        division = context["division"]
+        if division not in self._admitted:
+            total = self.row_count(context)
+            needed = None if total is None else max(-(-total // self.page_size), 1)
+            self._admitted[division] = self._tap.quota_planner.allows_partition(
+                self.name, division, self.resumable, needed
+            )
+        return self._admitted[division]
+
+    def repair_bounds(self, start: str, end: str, chunks: int) -> list[str]:
+        """Split a repair range into chunk boundaries.
+
+        Args:
+            start: First value of the range, inclusive.
+            end: Last value of the range, inclusive.
+            chunks: Number of chunks.
+
+        Returns:
+            The boundaries as OData literals, from start to end.
+
+        Raises:
+            ValueError: If a value is not a date-time or the range is inverted.
+        """
+        start_time, end_time = parse(start), parse(end)
+        if start_time > end_time:
+            msg = f"start {start} is after end {end}"
+            raise ValueError(msg)
+        step = (end_time - start_time) / chunks
+        bounds = [start_time + step * index for index in range(chunks)] + [end_time]
+        literals = [f"datetime'{bound.strftime('%Y-%m-%dT%H:%M:%S')}'" for bound in bounds]
+        return list(dict.fromkeys(literals))
+
+    def repair_partitions(
+        self, divisions: list[str], start: str, end: str, chunks: int
+    ) -> list[dict]:
+        """Return a context per division and chunk of a repair range.
+
+        Each context carries the filter of its chunk, which replaces the
+        bookmark filter of a normal sync.
+
+        Args:
+            divisions: The Exact divisions to repair.
+            start: First value of the range, inclusive.
+            end: Last value of the range, inclusive.
+            chunks: Number of chunks per division.
+
+        Returns:
+            The contexts of every slice.
+
+        Raises:
+            ValueError: If the range is invalid or there are no chunks.
+        """
+        if chunks < 1:
+            msg = f"chunks must be at least 1, got {chunks}"
+            raise ValueError(msg)
+        bounds = self.repair_bounds(start, end, chunks)
+        if len(bounds) == 1:
+            bounds = bounds * 2
+        filters = [
+            f"{self.repair_key} ge {lower} and {self.repair_key} "
+            f"{'le' if index == len(bounds) - 2 else 'lt'} {upper}"
+            for index, (lower, upper) in enumerate(zip(bounds, bounds[1:]))
+        ]
+        return [
+            {"division": division, "repair_filter": repair_filter}
+            for division in divisions
+            for repair_filter in filters
+        ]
+
+    def repair(self, context: dict) -> int:
+        """Emit the records of a repair slice, without touching the stream state.
+
+        Args:
+            context: A context from :meth:`repair_partitions`.
+
+        Returns:
+            The number of records emitted.
+        """
+        count = 0
+        for record in self.request_records(context):
+            record = self.post_process(record, context)
+            if record is not None:
+                self._write_record_message(record)
+                count += 1
+        self.logger.info(
+            "Repaired %d rows of division %s where %s.",
+            count,
+            context["division"],
+            context["repair_filter"],
+        )
+        return count
+
     @property
     def partitions(self) -> list[dict] | None:
         return [{"division": division} for division in self.config["divisions"]]
@@ -97,12 +434,16 @@ class ExactStream(RESTStream):
         return f"{self.url_base}/{context['division']}{self.path}"
 
     @cached_property
-    def authenticator(self) -> _Auth:
+    def authenticator(self) -> _Auth | None:
         """Return a new authenticator object.
 
+        Replayed runs are served from the response cache and need no tokens.
+
         Returns:
             An authenticator instance.
         """
+        if self.response_cache is not None and self.response_cache.mode == "replay":
+            return None
         return ExactAuthenticator(self)
 
     def get_starting_time(self, context):
@@ -118,8 +459,10 @@ class ExactStream(RESTStream):
         params: dict = {}
         if self.select:
             params["$select"] = self.select
-        start_date = self.get_starting_time(context).strftime("%Y-%m-%dT%H:%M:%S")
-        if self.replication_key:
+        if context and "repair_filter" in context:
+            params["$filter"] = context["repair_filter"]
+        elif self.replication_key:
+            start_date = self.get_starting_time(context).strftime("%Y-%m-%dT%H:%M:%S")
             date_filter = f"Modified gt datetime'{start_date}'"
             params["$filter"] = date_filter
         if next_page_token:
@@ -128,26 +471,368 @@ class ExactStream(RESTStream):
 
     def get_new_paginator(self) -> BaseOffsetPaginator:
         """Create a new pagination helper instance."""
-        return ExactPaginator(self, start_value=None, page_size=60)
+        return ExactPaginator(self, start_value=None, page_size=self.page_size)
+
+    def get_next_link(self, response: Response) -> str | None:
+        """Return the link to the next page of a response.
+
+        Args:
+            response: API response object.
+
+        Returns:
+            The next link, or None on the last page.
+        """
+        if hasattr(response, "next_link"):
+            return response.next_link
+        link = self.xml_to_dict(response).get("feed", {}).get("link", [])
+        if type(link) == list:
+            for item in link:
+                if item.get("@rel", "") == "next":
+                    return item["@href"]
+        return None
 
     def xml_to_dict(self, response):
+        if hasattr(response, "parsed_xml"):
+            return response.parsed_xml
         try:
             # clean invalid xml characters
             my_parser = etree.XMLParser(recover=True)
             xml = etree.fromstring(response.content, parser=my_parser)
             cleaned_xml_string = etree.tostring(xml)
             # parse xml to dict
-            data = json.loads(json.dumps(xmltodict.parse(cleaned_xml_string)))
+            data = xmltodict.parse(cleaned_xml_string)
         except:
-            data = json.loads(
-                json.dumps(
-                    xmltodict.parse(
-                        response.content.decode("utf-8-sig").encode("utf-8")
-                    )
-                )
-            )
+            data = xmltodict.parse(response.content.decode("utf-8-sig").encode("utf-8"))
+        # the paginator and validation read the same page, so parse it only once
+        response.parsed_xml = data
         return data
 
+    def read_page_tree(self, response: requests.Response) -> None:
+        """Parse a page with lxml only, keeping its entry elements for :func:`decode_entries`.
+
+        Args:
+            response: The HTTP ``requests.Response`` object.
+        """
+        feed = etree.fromstring(response.content, parser=etree.XMLParser(recover=True))
+        entries = feed.findall(f"{ATOM}entry") if feed is not None else []
+        if self.config.get("validate_pages", True):
+            self.validate_page(response, parsed=len(entries))
+
+        response.page_entries = entries
+        response.next_link = None
+        if feed is not None:
+            for link in feed.findall(f"{ATOM}link"):
+                if link.get("rel") == "next":
+                    response.next_link = link.get("href")
+
+    def spool_response(self, response: requests.Response) -> None:
+        """Read a streamed response body into a bounded buffer and verify it.
+
+        The body is kept in memory up to ``max_buffer_size`` bytes and spills to a
+        temporary file beyond that.
+
+        Args:
+            response: A streamed HTTP ``requests.Response`` object.
+
+        Raises:
+            InvalidPageError: If the page is truncated or has unbalanced entries.
+        """
+        spool = tempfile.SpooledTemporaryFile(
+            max_size=self.config.get("max_buffer_size", 8 * 1024 * 1024)
+        )
+        opened = closed = 0
+        tail = b""
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            spool.write(chunk)
+            window = tail + chunk
+            for match in ENTRY_TAG.finditer(window):
+                # tags fully inside the tail were counted with the previous chunk
+                if match.end() > len(tail):
+                    if match.group(1):
+                        closed += 1
+                    else:
+                        opened += 1
+            tail = window[-len(ENTRY_END):]
+        response.close()
+
+        spool.seek(max(spool.tell() - CHUNK_SIZE, 0))
+        if not spool.read().rstrip().endswith(b"</feed>"):
+            spool.close()
+            msg = f"Truncated page for path: {self.path}"
+            raise InvalidPageError(msg, response)
+        if opened != closed:
+            spool.close()
+            msg = f"Invalid page for path: {self.path}, {opened} entries but {closed} closed"
+            raise InvalidPageError(msg, response)
+
+        # parse the page once here, still inside the retry decorator, so a page
+        # with entries the parser drops is retried before any record is emitted
+        spool.seek(0)
+        parsed = 0
+        response.next_link = None
+        for _, element in etree.iterparse(spool, events=("end",), recover=True):
+            if element.tag == f"{ATOM}entry":
+                parsed += 1
+                self._release(element)
+            elif (
+                element.tag == f"{ATOM}link"
+                and element.get("rel") == "next"
+                and element.getparent().getparent() is None
+            ):
+                response.next_link = element.get("href")
+        if parsed != opened:
+            spool.close()
+            msg = (
+                f"Invalid page for path: {self.path}, "
+                f"expected {opened} entries but parsed {parsed}"
+            )
+            raise InvalidPageError(msg, response)
+
+        spool.seek(0)
+        response.spool = spool
+
+    @staticmethod
+    def _release(element: etree._Element) -> None:
+        # drop parsed entries so the tree never holds more than one
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+    def iter_spooled_entries(self, response: requests.Response) -> Iterable[dict]:
+        """Incrementally parse the entries of a spooled response.
+
+        Every entry element is released as soon as it is converted, so memory
+        stays flat regardless of the page size.
+
+        Args:
+            response: A response read by :meth:`spool_response`.
+
+        Yields:
+            Each entry, in the same shape as :meth:`xml_to_dict` produces.
+        """
+        with response.spool as spool:
+            for _, element in etree.iterparse(
+                spool, events=("end",), tag=f"{ATOM}entry", recover=True
+            ):
+                yield xmltodict.parse(etree.tostring(element))["entry"]
+                self._release(element)
+
+    def prepare_request(self, context: dict | None, next_page_token) -> requests.PreparedRequest:
+        """Prepare a request once the run's shared rate budget allows it.
+
+        Args:
+            context: The stream context.
+            next_page_token: The next page token.
+
+        Returns:
+            The prepared request.
+        """
+        self._tap.rate_budget.acquire()
+        return super().prepare_request(context, next_page_token)
+
+    def validate_response(self, response: requests.Response) -> None:
+        """Validate the response, marking transient Exact failures as retriable.
+
+        A 401 invalidates the access token so the retry is sent with a fresh one.
+        Only valid pages are written to the response cache, and a cached page
+        that turns out invalid is evicted so the retry fetches it again.
+
+        Args:
+            response: The HTTP ``requests.Response`` object.
+
+        Raises:
+            RetriableAPIError: If the token expired mid-run.
+        """
+        self._tap.rate_budget.update(response)
+        self._tap.quota_planner.update(self.name, self.division_of(response), response)
+        if response.status_code == HTTPStatus.UNAUTHORIZED and self.authenticator:
+            self.authenticator.invalidate_access_token()
+            msg = self.response_error_message(response)
+            raise RetriableAPIError(msg, response)
+        try:
+            super().validate_response(response)
+            if self.config.get("stream_responses", False):
+                self.spool_response(response)
+            elif self.config.get("lxml_pages", False):
+                self.read_page_tree(response)
+            elif self.config.get("validate_pages", True):
+                self.validate_page(response)
+        except RetriableAPIError:
+            if self.response_cache:
+                self.response_cache.evict(response)
+            raise
+        if self.response_cache:
+            self.response_cache.store(response)
+
+    def validate_page(self, response: requests.Response, parsed: int | None = None) -> None:
+        """Check that a page is complete and that every entry was parsed.
+
+        Args:
+            response: The HTTP ``requests.Response`` object.
+            parsed: The number of parsed entries, if the page was already parsed.
+
+        Raises:
+            InvalidPageError: If the page is truncated or entries were lost.
+        """
+        content = response.content
+        if not content.rstrip().endswith(b"</feed>"):
+            msg = f"Truncated page for path: {self.path}"
+            raise InvalidPageError(msg, response)
+
+        expected = len(ENTRY_START.findall(content))
+        if parsed is None:
+            entries = self.xml_to_dict(response).get("feed", {}).get("entry", [])
+            parsed = len(entries) if type(entries) == list else 1 if entries else 0
+        if expected != parsed or content.count(ENTRY_END) != expected:
+            msg = (
+                f"Invalid page for path: {self.path}, "
+                f"expected {expected} entries but parsed {parsed}"
+            )
+            raise InvalidPageError(msg, response)
+
+    def backoff_wait_generator(self) -> typing.Generator[float, None, None]:
+        """Wait exponentially between retries, but at least until the rate limit resets.
+
+        Returns:
+            The wait generator.
+        """
+        return self._retry_waits()
+
+    def _retry_waits(self) -> typing.Generator[float, None, None]:
+        waits = backoff.expo(
+            factor=self.config.get("backoff_factor", 2),
+            max_value=self.config.get("backoff_max_wait", 300),
+        )
+        next(waits)
+        exception = yield
+        while True:
+            wait = next(waits)
+            response = getattr(exception, "response", None)
+            if response is not None:
+                wait = max(wait, rate_limit_wait(response))
+            exception = yield wait
+
+    def backoff_max_tries(self) -> int:
+        """The number of attempts before giving up when retrying requests.
+
+        Returns:
+            Number of max tries.
+        """
+        return self.config.get("max_retries", 5) + 1
+
+    def backoff_handler(self, details: dict) -> None:
+        """Re-authenticate the request and count the retry before it is sent again.
+
+        Args:
+            details: backoff invocation details.
+        """
+        super().backoff_handler(details)
+        prepared_request, context = details["args"]
+        if self.authenticator:
+            prepared_request.headers.update(self.authenticator.auth_headers)
+        self.log_retry(context, details.get("exception"))
+
+    def log_retry(self, context: dict | None, exception: Exception | None) -> None:
+        """Count a retried request in the ``http_retry_count`` metric.
+
+        Args:
+            context: The stream context.
+            exception: The error the request is retried for.
+        """
+        response = getattr(exception, "response", None)
+        if isinstance(exception, InvalidPageError):
+            reason = "invalid_page"
+        elif response is not None:
+            reason = str(response.status_code)
+        else:
+            reason = type(exception).__name__
+
+        point = metrics.Point(
+            "counter",
+            metric=ExactMetric.HTTP_RETRY_COUNT,
+            value=1,
+            tags={
+                metrics.Tag.STREAM: self.name,
+                metrics.Tag.ENDPOINT: self.path,
+                metrics.Tag.CONTEXT: context,
+                "reason": reason,
+            },
+        )
+        self._log_metric(point)
+
+    def get_records(self, context: dict | None) -> Iterable[dict]:
+        """Return the records, suppressing rows that did not change since the last run.
+
+        With fingerprints, the last run is the one whose state was passed in:
+        the generation of fingerprints a run wrote is recorded in its partition
+        state, and only used as baseline once the target committed that state.
+
+        Args:
+            context: The stream context.
+
+        Yields:
+            Each new, updated or deleted record.
+        """
+        planner = self._tap.quota_planner
+        division = context["division"]
+        if not self.admit(context):
+            self.logger.warning(
+                "Not enough daily request quota left to sync '%s' for division %s, "
+                "skipping it until the next run.",
+                self.name,
+                division,
+            )
+            return
+
+        records = ProgressTracker(self.logger, division, self.row_count(context)).track(
+            super().get_records(context)
+        )
+        if not self.fingerprints:
+            yield from records
+        else:
+            state = self.get_context_state(context)
+            with self.fingerprints.partition(
+                division, state.get("fingerprint_generation")
+            ) as partition:
+                for record in records:
+                    if partition.changed(record):
+                        yield record
+                if planner.stopped(self.name, division):
+                    # rows past the page the quota stopped at are not gone
+                    partition.keep_unseen()
+                else:
+                    yield from partition.removed()
+            # the baseline of the next run, once the target committed this state
+            with self._tap._write_lock:
+                state["fingerprint_generation"] = partition.generation
+        planner.complete(self.name, division)
+
+    def request_records(self, context: dict | None) -> Iterable[dict]:
+        """Request records, from the async engine's prefetched pages if it is enabled.
+
+        Args:
+            context: The stream context.
+
+        Yields:
+            An item for every record in the response.
+        """
+        engine = self._tap.async_engine
+        if engine is None:
+            yield from super().request_records(context)
+            return
+
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+            for response in engine.pages(self, context):
+                request_counter.increment()
+                self._write_request_duration_log(
+                    endpoint=self.path,
+                    response=response,
+                    context=context,
+                    extra_tags=None,
+                )
+                yield from self.parse_response(response)
+
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
         """Parse the response and return an iterator of result records.
 
@@ -157,6 +842,12 @@ class ExactStream(RESTStream):
         Yields:
             Each record from the source.
         """
+        if hasattr(response, "spool"):
+            yield from self.iter_spooled_entries(response)
+            return
+        if hasattr(response, "page_entries"):
+            yield from decode_entries(response.page_entries, self.schema, self.edm_converters)
+            return
         data = self.xml_to_dict(response).get("feed", {}).get("entry", [])
         yield from extract_jsonpath(self.records_jsonpath, input=data)
 
@@ -174,6 +865,9 @@ class ExactStream(RESTStream):
         Returns:
             The updated record dictionary, or ``None`` to skip the record.
         """
+        if "content" not in row:
+            # already normalized by decode_entries
+            return row
         content = row["content"]["m:properties"]
         new_content = {}
         for key, value in content.items():
@@ -182,39 +876,121 @@ class ExactStream(RESTStream):
                 new_content[new_key] = value
             elif not value or value.get("@m:null") == "true":
                 new_content[new_key] = None
-            elif value.get("@m:type") == "Edm.Boolean":
-                if value.get("#text") == "true":
-                    new_content[new_key] = True
-                elif value.get("#text") == "false":
-                    new_content[new_key] = False
-                else:
-                    new_content[new_key] = None
-            elif "Int" in value.get("@m:type", ""):
-                new_content[new_key] = int(value.get("#text"))
-            elif "Double" in value.get("@m:type", ""):
-                new_content[new_key] = float(value.get("#text"))
             else:
-                new_content[new_key] = value.get("#text", None)
+                text = value.get("#text")
+                convert = self.edm_converters.get(value.get("@m:type"))
+                if text is None or convert is None:
+                    new_content[new_key] = text
+                else:
+                    new_content[new_key] = convert(text)
         row = new_content
         return row
 
+    # State. The tap state is shared by every stream, which may run in parallel
+    # threads, so it is only read and written under the tap's write lock.
+
+    def get_context_state(self, context: dict | None) -> dict:
+        """Return the writeable state of a context, creating it under the state lock.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The partition state, or the stream state.
+        """
+        with self._tap._write_lock:
+            return super().get_context_state(context)
+
+    def _increment_stream_state(self, latest_record: dict, *, context: dict | None = None) -> None:
+        with self._tap._write_lock:
+            super()._increment_stream_state(latest_record, context=context)
+
+    def _write_starting_replication_value(self, context: dict | None) -> None:
+        with self._tap._write_lock:
+            super()._write_starting_replication_value(context)
+
+    def _write_replication_key_signpost(self, context: dict | None, value) -> None:
+        with self._tap._write_lock:
+            super()._write_replication_key_signpost(context, value)
+
+    def _write_state_message(self) -> None:
+        # compared, written and copied as one snapshot, while no thread changes it
+        with self._tap._write_lock:
+            super()._write_state_message()
+
+    def _finalize_state(self, state: dict | None = None) -> None:
+        with self._tap._write_lock:
+            super()._finalize_state(state)
+
+    def reset_state_progress_markers(self, state: dict | None = None) -> None:
+        """Reset the progress markers of the stream under the state lock.
+
+        Args:
+            state: State object to reset the progress markers of.
+        """
+        with self._tap._write_lock:
+            super().reset_state_progress_markers(state)
+
+    def finalize_state_progress_markers(self, state: dict | None = None) -> None:
+        """Promote the progress markers of the stream under the state lock.
+
+        Args:
+            state: State object to promote progress markers with.
+        """
+        with self._tap._write_lock:
+            super().finalize_state_progress_markers(state)
+
     @property
     def select(self):
-        return ",".join(self.schema["properties"].keys())
+        return ",".join(
+            key for key in self.schema["properties"].keys() if not key.startswith("_sdc_")
+        )
 
 
 class ExactSyncStream(ExactStream):
     """Exact sync stream class."""
 
-    def get_new_paginator(self) -> BaseOffsetPaginator:
-        """Create a new pagination helper instance."""
-        return ExactPaginator(self, start_value=None, page_size=1000)
+    # The sync endpoints return rows in Timestamp order.
+    resumable = True
+    page_size = 1000
+    repair_key = "Timestamp"
+
+    def repair_bounds(self, start: str, end: str, chunks: int) -> list[str]:
+        """Split a Timestamp repair range into chunk boundaries.
+
+        Args:
+            start: First Timestamp of the range, inclusive.
+            end: Last Timestamp of the range, inclusive.
+            chunks: Number of chunks.
+
+        Returns:
+            The boundaries as OData literals, from start to end.
+
+        Raises:
+            ValueError: If a value is not an integer or the range is inverted.
+        """
+        try:
+            start_timestamp, end_timestamp = int(start), int(end)
+        except ValueError as ex:
+            msg = f"Timestamps must be integers, got {start!r} and {end!r}"
+            raise ValueError(msg) from ex
+        if start_timestamp > end_timestamp:
+            msg = f"start {start} is after end {end}"
+            raise ValueError(msg)
+        step = -(-(end_timestamp - start_timestamp) // chunks)
+        bounds = list(range(start_timestamp, end_timestamp, step or 1)) + [end_timestamp]
+        return list(dict.fromkeys(f"{bound}L" for bound in bounds))
 
     def get_starting_time(self, context):
-        state = self.get_context_state(context)
-        rep_key = None
-        if "replication_key_value" in state.keys():
-            rep_key = state["replication_key_value"]
+        # read without creating the partition state, as the async engine and
+        # row counts build parameters before the SDK syncs the partition
+        with self._tap._write_lock:
+            rep_key = get_state_if_exists(
+                self.tap_state,
+                self.name,
+                self._get_state_partition_context(context),
+                key="replication_key_value",
+            )
         return rep_key or 1
 
     def get_url_params(
@@ -223,12 +999,15 @@ class ExactSyncStream(ExactStream):
         params: dict = {}
         if self.select:
             params["$select"] = self.select
-        start_timestamp = self.get_starting_time(context)
-        if start_timestamp == 1:
-            date_filter = f"Timestamp gt {start_timestamp}"
+        if context and "repair_filter" in context:
+            params["$filter"] = context["repair_filter"]
         else:
-            date_filter = f"Timestamp gt {start_timestamp}L"
-        params["$filter"] = date_filter
+            start_timestamp = self.get_starting_time(context)
+            if start_timestamp == 1:
+                date_filter = f"Timestamp gt {start_timestamp}"
+            else:
+                date_filter = f"Timestamp gt {start_timestamp}L"
+            params["$filter"] = date_filter
         if next_page_token:
             params["$skiptoken"] = next_page_token
         return params
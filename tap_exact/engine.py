@@ -0,0 +1,241 @@
+"""Asyncio extraction engine that fetches the pages of many streams and divisions at once."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+import time
+import typing
+from datetime import timedelta
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from singer_sdk.exceptions import RetriableAPIError
+
+if typing.TYPE_CHECKING:
+    import httpx
+    from singer_sdk import Tap
+
+    from tap_exact.client import ExactStream
+
+_DONE = object()
+
+
+def to_requests_response(response: httpx.Response, elapsed: float) -> requests.Response:
+    """Convert an httpx response so the stream's validation and parsing apply as is.
+
+    Args:
+        response: An httpx response with its body read.
+        elapsed: Seconds the request took.
+
+    Returns:
+        An equivalent ``requests.Response``.
+    """
+    result = requests.Response()
+    result.status_code = response.status_code
+    result.reason = response.reason_phrase
+    result.headers = CaseInsensitiveDict(response.headers)
+    result.raw = io.BytesIO(response.content)
+    result.url = str(response.url)
+    result.elapsed = timedelta(seconds=elapsed)
+    return result
+
+
+class AsyncEngine:
+    """Fetch pages for every selected stream and division on one event loop.
+
+    The loop runs in a background thread and walks each cursor (a stream and a
+    division) concurrently, keeping at most ``async_prefetch_pages`` pages
+    ahead per cursor. The SDK still syncs streams and divisions in its usual
+    order on the main thread, consuming the prefetched pages, so the Singer
+    output is the same as with the sync engine.
+    """
+
+    def __init__(self, tap: Tap, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        """Init engine.
+
+        Args:
+            tap: The tap whose streams are extracted.
+            transport: Optional httpx transport, mainly for tests.
+        """
+        try:
+            import httpx
+        except ImportError as ex:
+            msg = "The async engine requires httpx to be installed."
+            raise RuntimeError(msg) from ex
+
+        self.httpx = httpx
+        self.tap = tap
+        self.transport = transport
+        self.max_connections = tap.config.get("async_max_connections", 8)
+        self.prefetch_pages = tap.config.get("async_prefetch_pages", 2)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.queues: dict[tuple[str, str], asyncio.Queue] = {}
+        self.tasks: list[asyncio.Future] = []
+        self.client: httpx.AsyncClient = self._run(self._create_client())
+
+    def _run(self, coroutine: typing.Coroutine) -> typing.Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    async def _create_client(self) -> httpx.AsyncClient:
+        limits = self.httpx.Limits(max_connections=self.max_connections)
+        return self.httpx.AsyncClient(limits=limits, transport=self.transport)
+
+    def start(self, streams: typing.Iterable[ExactStream]) -> None:
+        """Start walking every division of the given streams that fits the daily quota.
+
+        Divisions the quota planner rejects are not prefetched, and the sync
+        skips them too, as it follows the same decision.
+
+        Args:
+            streams: The selected Exact streams.
+        """
+        for stream in streams:
+            for context in stream.partitions:
+                if stream.admit(context):
+                    self.add_cursor(stream, context)
+
+    def add_cursor(self, stream: ExactStream, context: dict | None) -> asyncio.Queue:
+        """Start walking the pages of a stream and division, unless already started.
+
+        The first page's parameters are built here, on the calling thread, so the
+        stream state is never read from the event loop. Building them reads the
+        bookmark without creating any state, so STATE messages are the same as
+        with the sync engine.
+
+        Args:
+            stream: The stream to fetch.
+            context: The stream partition.
+
+        Returns:
+            The queue the pages of the cursor are put on.
+        """
+        key = (stream.name, (context or {}).get("division"))
+        if key not in self.queues:
+            url = stream.get_url(context)
+            params = stream.get_url_params(context, None)
+            headers = stream.http_headers
+            # built in the calling thread, as the authenticator may read its blob
+            authenticator = stream.authenticator
+            self.queues[key] = self._run(self._create_queue())
+            self.tasks.append(
+                asyncio.run_coroutine_threadsafe(
+                    self._walk(
+                        stream, context, authenticator, url, params, headers, self.queues[key]
+                    ),
+                    self.loop,
+                )
+            )
+        return self.queues[key]
+
+    async def _create_queue(self) -> asyncio.Queue:
+        return asyncio.Queue(maxsize=self.prefetch_pages)
+
+    def pages(self, stream: ExactStream, context: dict | None) -> typing.Iterable[requests.Response]:
+        """Return the validated pages of a stream and division, in order.
+
+        Args:
+            stream: The stream to fetch.
+            context: The stream partition.
+
+        Yields:
+            Each page, as a ``requests.Response``.
+
+        Raises:
+            Exception: Any error that ended the walk of this cursor.
+        """
+        queue = self.add_cursor(stream, context)
+        while True:
+            page = self._run(queue.get())
+            if page is _DONE:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+
+    async def _walk(
+        self,
+        stream: ExactStream,
+        context: dict | None,
+        authenticator,
+        url: str,
+        params: dict,
+        headers: dict,
+        queue: asyncio.Queue,
+    ) -> None:
+        try:
+            while True:
+                response = await self._request(
+                    stream, context, authenticator, url, params, headers
+                )
+                # parses the page unless validation already did, keep it off the loop
+                next_page_token = await asyncio.to_thread(
+                    stream.get_new_paginator().get_next, response
+                )
+                await queue.put(response)
+                if not next_page_token or not stream.has_quota_for_next_page(response):
+                    break
+                params = {**params, "$skiptoken": next_page_token}
+            await queue.put(_DONE)
+        except Exception as ex:  # noqa: BLE001
+            await queue.put(ex)
+
+    async def _request(
+        self,
+        stream: ExactStream,
+        context: dict | None,
+        authenticator,
+        url: str,
+        params: dict,
+        headers: dict,
+    ) -> requests.Response:
+        """Send a request, retrying with the stream's own retry policy."""
+        waits = stream.backoff_wait_generator()
+        next(waits)
+        max_tries = stream.backoff_max_tries()
+        tries = 0
+        while True:
+            tries += 1
+            # the minutely limit and max_requests_per_minute are shared with every
+            # stream of the run, and acquiring may sleep, so not on the loop
+            await asyncio.to_thread(self.tap.rate_budget.acquire)
+            request_headers = dict(headers)
+            if authenticator:
+                request_headers["Authorization"] = f"Bearer {await self._access_token(authenticator)}"
+            try:
+                started = time.monotonic()
+                response = await self.client.get(
+                    url, params=params, headers=request_headers, timeout=stream.timeout
+                )
+                response = to_requests_response(response, time.monotonic() - started)
+                # validation parses the page, keep that off the event loop
+                await asyncio.to_thread(stream.validate_response, response)
+            except (RetriableAPIError, self.httpx.TransportError) as ex:
+                if tries >= max_tries:
+                    raise
+                wait = stream.backoff_jitter(waits.send(ex))
+                stream.logger.warning(
+                    "Backing off %0.2f seconds after %d tries: %s", wait, tries, ex
+                )
+                stream.log_retry(context, ex)
+                await asyncio.sleep(wait)
+                continue
+            return response
+
+    async def _access_token(self, authenticator) -> str:
+        if not authenticator.is_token_valid():
+            # refreshed under the authenticator's own lock, shared with the sync
+            # requests of the run, as Exact rotates the refresh token
+            await asyncio.to_thread(authenticator.update_access_token)
+        return authenticator.access_token
+
+    def close(self) -> None:
+        """Cancel any remaining walks and stop the event loop."""
+        for task in self.tasks:
+            task.cancel()
+        self._run(self.client.aclose())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
@@ -0,0 +1,153 @@
+"""Row fingerprint index used to suppress unchanged rows of full-reload streams."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable
+
+from singer_sdk.helpers._util import utc_now
+
+
+class FingerprintIndex:
+    """SQLite index of primary key to row hash for a single stream.
+
+    Each stream gets its own database file in ``directory``. Every run of a
+    division writes its fingerprints as a new generation, and compares rows
+    with the generation recorded in the incoming Singer state. A generation
+    thus only becomes the baseline once the target committed the state of the
+    run that wrote it, and a run whose output was lost is diffed again.
+    """
+
+    def __init__(self, directory: str, stream_name: str, primary_keys: list[str]) -> None:
+        """Init fingerprint index.
+
+        Args:
+            directory: Directory where the index databases are stored.
+            stream_name: Name of the stream.
+            primary_keys: Primary keys of the stream.
+        """
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self.path = Path(directory) / f"{stream_name}.sqlite"
+        self.primary_keys = list(primary_keys)
+
+    def partition(self, division: str, baseline: int | None = None) -> FingerprintPartition:
+        """Open the fingerprints of a division.
+
+        Args:
+            division: The Exact division.
+            baseline: The generation of the incoming state, None if there is none.
+
+        Returns:
+            A context manager that commits the new generation on a clean exit.
+        """
+        return FingerprintPartition(self, str(division), baseline)
+
+
+class FingerprintPartition:
+    """Fingerprints of one stream and division, written as a new generation.
+
+    Rows are compared with the ``baseline`` generation, and every row read is
+    written to ``generation``. Without a baseline every row is new. Nothing is
+    committed unless the partition is fully read, so a failed or interrupted
+    sync re-emits the same changes on the next run.
+
+    Attributes:
+        generation: The generation written by this run.
+    """
+
+    def __init__(self, index: FingerprintIndex, division: str, baseline: int | None) -> None:
+        self.index = index
+        self.division = division
+        self.baseline = baseline
+        self.generation: int | None = None
+        self.connection: sqlite3.Connection | None = None
+
+    def __enter__(self) -> FingerprintPartition:
+        self.connection = sqlite3.connect(self.index.path)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                division TEXT NOT NULL,
+                generation INTEGER NOT NULL,
+                key TEXT NOT NULL,
+                hash BLOB NOT NULL,
+                PRIMARY KEY (division, generation, key)
+            ) WITHOUT ROWID
+            """
+        )
+        (latest,) = self.connection.execute(
+            "SELECT MAX(generation) FROM fingerprints WHERE division = ?", (self.division,)
+        ).fetchone()
+        # generations newer than the baseline were never committed by a target
+        self.connection.execute(
+            "DELETE FROM fingerprints WHERE division = ? AND generation IS NOT ?",
+            (self.division, self.baseline),
+        )
+        self.generation = max(latest or 0, self.baseline or 0) + 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.connection.commit()
+        else:
+            self.connection.rollback()
+        self.connection.close()
+        self.connection = None
+
+    def changed(self, record: dict) -> bool:
+        """Record the fingerprint of a row and tell whether it is new or updated.
+
+        Args:
+            record: A post-processed record.
+
+        Returns:
+            False if the row is unchanged since the baseline, otherwise True.
+        """
+        key = json.dumps([record.get(pk) for pk in self.index.primary_keys], default=str)
+        row_hash = hashlib.blake2b(
+            json.dumps(record, sort_keys=True, default=str).encode(), digest_size=16
+        ).digest()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO fingerprints (division, generation, key, hash) "
+            "VALUES (?, ?, ?, ?)",
+            (self.division, self.generation, key, row_hash),
+        )
+        stored = self.connection.execute(
+            "SELECT hash FROM fingerprints WHERE division = ? AND generation = ? AND key = ?",
+            (self.division, self.baseline, key),
+        ).fetchone()
+        return not stored or stored[0] != row_hash
+
+    def removed(self) -> Iterable[dict]:
+        """Return the rows of the baseline that were not seen in this run.
+
+        Yields:
+            A record with the primary keys and ``_sdc_deleted_at`` for each row.
+        """
+        deleted_at = utc_now().isoformat()
+        keys = self.connection.execute(
+            "SELECT key FROM fingerprints AS old WHERE division = ? AND generation = ? "
+            "AND NOT EXISTS (SELECT 1 FROM fingerprints AS new WHERE new.division = "
+            "old.division AND new.generation = ? AND new.key = old.key)",
+            (self.division, self.baseline, self.generation),
+        ).fetchall()
+        for (key,) in keys:
+            record = dict(zip(self.index.primary_keys, json.loads(key)))
+            record["_sdc_deleted_at"] = deleted_at
+            yield record
+
+    def keep_unseen(self) -> None:
+        """Carry the baseline rows not seen in this run over to the new generation.
+
+        Used when a run stops early, so rows past the last page are neither
+        reported as deleted nor as new on the next run.
+        """
+        self.connection.execute(
+            "INSERT OR IGNORE INTO fingerprints (division, generation, key, hash) "
+            "SELECT division, ?, key, hash FROM fingerprints "
+            "WHERE division = ? AND generation = ?",
+            (self.generation, self.division, self.baseline),
+        )
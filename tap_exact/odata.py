@@ -0,0 +1,123 @@
+"""Conversion of OData ``Edm`` values to their Singer representation."""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache, partial
+from typing import Any, Callable
+
+from pendulum import parse
+from pendulum import timezone as get_timezone
+
+# Exact emits Edm.DateTime as a naive ISO timestamp, with an optional fraction.
+DATETIME = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:\.(\d{1,7}))?(Z|[+-]\d\d:\d\d)?")
+MIDNIGHT = "T00:00:00"
+# Exact returns naive date-times in the local time of the administration.
+DEFAULT_TIMEZONE = "Europe/Amsterdam"
+
+
+@lru_cache(maxsize=None)
+def _timezone(name: str):
+    return get_timezone(name)
+
+
+@lru_cache(maxsize=65536)
+def _utc_offset(hour: str, timezone: str) -> str | None:
+    # offsets only change on the hour, so one lookup serves a whole hour, and
+    # the cache holds several years of hours
+    moment = datetime(
+        int(hour[:4]), int(hour[5:7]), int(hour[8:10]), int(hour[11:13]),
+        tzinfo=_timezone(timezone),
+    )
+    offset = moment.utcoffset()
+    if offset != moment.replace(fold=1).utcoffset():
+        # skipped or repeated by a DST change, left to pendulum
+        return None
+    minutes = int(offset.total_seconds()) // 60
+    sign = "-" if minutes < 0 else "+"
+    return f"{sign}{abs(minutes) // 60:02}:{abs(minutes) % 60:02}"
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(text: str, timezone: str) -> str:
+    # dates like Date and DueDate repeat across many rows
+    return _parse(text, timezone)
+
+
+def _parse(text: str, timezone: str) -> str:
+    match = DATETIME.fullmatch(text)
+    if match is None:
+        return parse(text, tz=timezone).isoformat()
+    fraction, offset = match.groups()
+    if offset is None:
+        offset = _utc_offset(text[:13], timezone)
+        if offset is None:
+            return parse(text, tz=timezone).isoformat()
+    elif offset == "Z":
+        offset = "+00:00"
+    fraction = fraction and fraction[:6].ljust(6, "0")
+    if not fraction or fraction == "000000":
+        return f"{text[:19]}{offset}"
+    return f"{text[:19]}.{fraction}{offset}"
+
+
+def parse_datetime(text: str, timezone: str = DEFAULT_TIMEZONE) -> str:
+    """Normalize an OData date-time to RFC 3339.
+
+    Naive values are taken as local time in ``timezone`` and get its UTC offset
+    at that moment. Fractions are written as microseconds, like
+    ``datetime.isoformat`` does, so the SDK and targets need not parse them
+    again. Date-only values are cached.
+
+    Args:
+        text: The ``Edm.DateTime`` text.
+        timezone: The time zone of naive values.
+
+    Returns:
+        The RFC 3339 date-time.
+    """
+    if text.endswith(MIDNIGHT):
+        return _parse_date(text, timezone)
+    return _parse(text, timezone)
+
+
+def _boolean(text: str) -> bool | None:
+    if text == "true":
+        return True
+    if text == "false":
+        return False
+    return None
+
+
+EDM_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "Edm.Boolean": _boolean,
+    "Edm.Byte": int,
+    "Edm.SByte": int,
+    "Edm.Int16": int,
+    "Edm.Int32": int,
+    "Edm.Int64": int,
+    "Edm.Single": float,
+    "Edm.Double": float,
+    "Edm.Decimal": Decimal,
+    "Edm.DateTime": parse_datetime,
+    "Edm.DateTimeOffset": parse_datetime,
+}
+
+
+def edm_converters(timezone: str = DEFAULT_TIMEZONE) -> dict[str, Callable[[str], Any]]:
+    """Return the converters of every Edm type, reading naive date-times in a time zone.
+
+    Args:
+        timezone: The time zone of naive date-times.
+
+    Returns:
+        The converter of each ``m:type``.
+    """
+    convert_datetime = partial(parse_datetime, timezone=timezone)
+    return {
+        **EDM_CONVERTERS,
+        "Edm.DateTime": convert_datetime,
+        "Edm.DateTimeOffset": convert_datetime,
+    }
@@ -0,0 +1,84 @@
+"""Progress reporting for long stream partitions."""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import timedelta
+from typing import Iterable, Iterator
+
+LOG_INTERVAL = 60.0
+
+
+class ProgressTracker:
+    """Log the progress of a stream and division at a fixed interval.
+
+    With a known total, the log includes the percentage done and an ETA,
+    otherwise only the rows so far and the rate.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        division: str,
+        total: int | None = None,
+        interval: float = LOG_INTERVAL,
+    ) -> None:
+        """Init progress tracker.
+
+        Args:
+            logger: The stream logger.
+            division: The Exact division.
+            total: Expected number of rows, if known.
+            interval: Seconds between progress logs.
+        """
+        self.logger = logger
+        self.division = division
+        self.total = total
+        self.interval = interval
+        self.rows = 0
+        self.started = time.monotonic()
+        self.last_logged = self.started
+
+    def track(self, records: Iterable[dict]) -> Iterator[dict]:
+        """Count records as they pass through.
+
+        Args:
+            records: The records of the partition.
+
+        Yields:
+            Each record, unchanged.
+        """
+        for record in records:
+            self.rows += 1
+            now = time.monotonic()
+            if now - self.last_logged >= self.interval:
+                self.last_logged = now
+                self.log(now)
+            yield record
+        self.log(time.monotonic())
+
+    def log(self, now: float) -> None:
+        """Log the progress so far.
+
+        Args:
+            now: The current monotonic time.
+        """
+        elapsed = now - self.started
+        rate = self.rows / elapsed if elapsed else 0.0
+        if not self.total:
+            self.logger.info(
+                "Division %s: %d rows, %.0f rows/sec", self.division, self.rows, rate
+            )
+            return
+        done = min(self.rows / self.total, 1.0)
+        eta = timedelta(seconds=round((self.total - self.rows) / rate)) if rate else None
+        self.logger.info(
+            "Division %s: %.1f%% (%d/%d rows), %.0f rows/sec, ETA %s",
+            self.division,
+            done * 100,
+            self.rows,
+            self.total,
+            rate,
+            eta if eta is not None and self.rows < self.total else "0:00:00",
+        )
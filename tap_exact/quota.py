@@ -0,0 +1,155 @@
+"""Daily request quota accounting and planning, persisted in the tap state."""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from requests import Response
+
+
+class QuotaPlanner:
+    """Track the daily Exact quota per division and decide what may still be fetched.
+
+    The last observed ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` of every
+    division, and the requests each stream and division took on its last
+    complete run, are kept under the ``quota`` key of the state, so the next run
+    starts with them.
+    """
+
+    def __init__(
+        self,
+        state: dict,
+        reserve: int = 0,
+        lock: threading.RLock | None = None,
+    ) -> None:
+        """Init quota planner.
+
+        Args:
+            state: The tap state, updated in place.
+            reserve: Requests per division to leave unused for other runs.
+            lock: The lock the tap state is written under, a new one by default.
+        """
+        quota = state.setdefault("quota", {})
+        self.divisions: dict[str, dict] = quota.setdefault("divisions", {})
+        self.requests: dict[str, dict] = quota.setdefault("requests", {})
+        self.reserve = reserve
+        self._counts: dict[tuple[str, str], int] = {}
+        self._stopped: set[tuple[str, str]] = set()
+        self._lock = lock or threading.RLock()
+
+    def remaining(self, division: str) -> int | None:
+        """Return the requests left today for a division.
+
+        Args:
+            division: The Exact division.
+
+        Returns:
+            The remaining requests, or None if unknown or reset since observed.
+        """
+        observed = self.divisions.get(division)
+        if not observed or observed["reset"] <= time.time() * 1000:
+            return None
+        return observed["remaining"]
+
+    def estimate(self, stream_name: str, division: str) -> int:
+        """Estimate the requests a stream needs for a division.
+
+        Args:
+            stream_name: Name of the stream.
+            division: The Exact division.
+
+        Returns:
+            The requests of the last complete run, or 1 if there was none.
+        """
+        return self.requests.get(stream_name, {}).get(division, 1)
+
+    def update(self, stream_name: str, division: str, response: Response) -> None:
+        """Count a request and record the quota reported by its response.
+
+        Args:
+            stream_name: Name of the stream.
+            division: The Exact division.
+            response: API response object.
+        """
+        with self._lock:
+            key = (stream_name, division)
+            self._counts[key] = self._counts.get(key, 0) + 1
+            remaining = response.headers.get("X-RateLimit-Remaining")
+            reset = response.headers.get("X-RateLimit-Reset")
+            if remaining is not None and reset is not None:
+                self.divisions[division] = {"remaining": int(remaining), "reset": int(reset)}
+
+    def allows_partition(
+        self,
+        stream_name: str,
+        division: str,
+        resumable: bool,
+        needed: int | None = None,
+    ) -> bool:
+        """Tell whether a stream may start on a division.
+
+        A resumable stream may start as long as anything is left above the
+        reserve, as it can stop at any page. Other streams only start if their
+        estimated requests fit.
+
+        Args:
+            stream_name: Name of the stream.
+            division: The Exact division.
+            resumable: Whether the stream can stop after any page and resume later.
+            needed: Requests the partition needs, if known from a row count.
+
+        Returns:
+            True if the partition may be synced.
+        """
+        remaining = self.remaining(division)
+        if remaining is None:
+            return True
+        if resumable:
+            needed = 1
+        elif needed is None:
+            needed = self.estimate(stream_name, division)
+        return remaining - needed >= self.reserve
+
+    def allows_next_page(self, stream_name: str, division: str) -> bool:
+        """Tell whether a stream may fetch another page, stopping it otherwise.
+
+        Args:
+            stream_name: Name of the stream.
+            division: The Exact division.
+
+        Returns:
+            True if a request is left above the reserve.
+        """
+        remaining = self.remaining(division)
+        if remaining is None or remaining > self.reserve:
+            return True
+        with self._lock:
+            self._stopped.add((stream_name, division))
+        return False
+
+    def stopped(self, stream_name: str, division: str) -> bool:
+        """Tell whether a stream was stopped early on a division.
+
+        Args:
+            stream_name: Name of the stream.
+            division: The Exact division.
+
+        Returns:
+            True if the quota ran out before the last page.
+        """
+        return (stream_name, division) in self._stopped
+
+    def complete(self, stream_name: str, division: str) -> None:
+        """Remember the requests of a finished partition for the next estimate.
+
+        Args:
+            stream_name: Name of the stream.
+            division: The Exact division.
+        """
+        with self._lock:
+            count = self._counts.pop((stream_name, division), 0)
+            if count and not self.stopped(stream_name, division):
+                self.requests.setdefault(stream_name, {})[division] = count
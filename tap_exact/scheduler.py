@@ -0,0 +1,102 @@
+"""Concurrent stream scheduling under a shared request budget."""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from tap_exact.client import rate_limit_wait
+
+if typing.TYPE_CHECKING:
+    from requests import Response
+
+    from tap_exact.client import ExactStream
+
+
+class RateBudget:
+    """Minutely request budget shared by every stream of a run.
+
+    Requests wait while the Exact minutely limit is exhausted, and, if
+    ``requests_per_minute`` is set, whenever that many requests were sent in
+    the last minute.
+    """
+
+    def __init__(self, requests_per_minute: int | None = None) -> None:
+        """Init rate budget.
+
+        Args:
+            requests_per_minute: Optional cap on the requests sent per minute.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.blocked_until = 0.0
+        self._sent: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent, and count it."""
+        while True:
+            with self._lock:
+                now = time.time()
+                wait = self.blocked_until - now
+                if wait <= 0 and self.requests_per_minute:
+                    while self._sent and self._sent[0] <= now - 60:
+                        self._sent.popleft()
+                    if len(self._sent) >= self.requests_per_minute:
+                        wait = self._sent[0] + 60 - now
+                if wait <= 0:
+                    if self.requests_per_minute:
+                        self._sent.append(now)
+                    return
+            time.sleep(wait)
+
+    def update(self, response: Response) -> None:
+        """Pause every stream until the minutely limit resets, if it was reached.
+
+        Args:
+            response: API response object.
+        """
+        wait = rate_limit_wait(response)
+        if wait:
+            with self._lock:
+                self.blocked_until = max(self.blocked_until, time.time() + wait)
+
+
+def sync_concurrently(streams: list[ExactStream], max_workers: int) -> None:
+    """Sync streams in parallel threads, starting with the largest ones.
+
+    Args:
+        streams: The selected streams.
+        max_workers: Maximum number of streams synced at the same time.
+
+    Raises:
+        Exception: The first error of a failed stream, once all streams ended.
+    """
+    streams = sorted(streams, key=lambda stream: stream.estimate_size(), reverse=True)
+
+    def sync(stream: ExactStream) -> None:
+        stream.sync()
+        stream.finalize_state_progress_markers()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stream") as executor:
+        futures = [executor.submit(sync, stream) for stream in streams]
+    for future in futures:
+        future.result()
+
+
+def repair_concurrently(stream: ExactStream, partitions: list[dict], max_workers: int) -> int:
+    """Emit the repair slices of a stream in parallel threads.
+
+    Args:
+        stream: The stream to repair.
+        partitions: The contexts of the slices to fetch.
+        max_workers: Maximum number of slices fetched at the same time.
+
+    Returns:
+        The number of records emitted.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="repair") as executor:
+        futures = [executor.submit(stream.repair, context) for context in partitions]
+    return sum(future.result() for future in futures)
@@ -24,6 +24,7 @@ class TransactionLinesStream(ExactSyncStream):
     path = "/sync/Financial/TransactionLines"
     primary_keys: t.ClassVar[list[str]] = ["ID", "Division"]
     replication_key = "Timestamp"
+    relative_size = 100
     schema = PropertiesList(
         Property("Timestamp", IntegerType),
         Property("Account", StringType),
@@ -213,6 +214,7 @@ class SalesInvoicesStream(ExactSyncStream):
     path = "/sync/SalesInvoice/SalesInvoices"
     primary_keys: t.ClassVar[list[str]] = ["ID", "Division"]
     replication_key = "Timestamp"
+    relative_size = 10
 
     schema = PropertiesList(
         Property("Timestamp", IntegerType),
@@ -339,6 +341,7 @@ class DeletedStream(ExactSyncStream):
     primary_keys = ["ID"]
     path = "/sync/Deleted"
     replication_key = "Timestamp"
+    relative_size = 5
 
     schema = PropertiesList(
         Property("Timestamp", IntegerType),
@@ -355,6 +358,7 @@ class SalesEntryLinesStream(ExactStream):
     name = "sales_entry_lines"
     primary_keys = ["ID"]
     path = "/salesentry/SalesEntryLines"
+    relative_size = 20
 
     schema = PropertiesList(
         Property("EntryID", StringType),
@@ -413,6 +417,7 @@ class SalesEntriesStream(ExactStream):
     name = "sales_entries"
     primary_keys = ["EntryID"]
     path = "/salesentry/SalesEntries"
+    relative_size = 10
 
     schema = PropertiesList(
         Property("AmountDC", NumberType),
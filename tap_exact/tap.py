@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import copy
+import threading
+from functools import cached_property
+
+import pendulum
 from singer_sdk import Tap
+from singer_sdk._singerlib import StateMessage
+from singer_sdk.exceptions import ConfigValidationError
 from singer_sdk.typing import (
     DateTimeType,
     StringType,
     Property,
     PropertiesList,
     ArrayType,
+    BooleanType,
+    ObjectType,
+    IntegerType,
+    NumberType,
 )
 
 from tap_exact import streams
+from tap_exact.engine import AsyncEngine
+from tap_exact.odata import DEFAULT_TIMEZONE
+from tap_exact.quota import QuotaPlanner
+from tap_exact.scheduler import RateBudget, repair_concurrently, sync_concurrently
 
 
 class TapExact(Tap):
@@ -26,8 +41,231 @@ class TapExact(Tap):
         Property("azure_connection_string", StringType, required=True),
         Property("blob_storage_path", StringType, required=True),
         Property("divisions", ArrayType(StringType), required=True),
+        Property(
+            "max_retries",
+            IntegerType,
+            default=5,
+            description="Retries for 5xx, 429, 401 and truncated or invalid pages.",
+        ),
+        Property(
+            "backoff_factor",
+            NumberType,
+            default=2,
+            description="Factor of the exponential backoff between retries, in seconds.",
+        ),
+        Property(
+            "backoff_max_wait",
+            NumberType,
+            default=300,
+            description="Maximum backoff between retries, in seconds.",
+        ),
+        Property(
+            "validate_pages",
+            BooleanType,
+            default=True,
+            description="Retry pages that are truncated or lose entries while parsing.",
+        ),
+        Property(
+            "stream_responses",
+            BooleanType,
+            default=False,
+            description=(
+                "Read response bodies incrementally and parse entries as they arrive. "
+                "The response cache is not used with streamed responses."
+            ),
+        ),
+        Property(
+            "max_buffer_size",
+            IntegerType,
+            default=8 * 1024 * 1024,
+            description=(
+                "Bytes of a streamed response kept in memory before it spills to a "
+                "temporary file."
+            ),
+        ),
+        Property(
+            "lxml_pages",
+            BooleanType,
+            default=False,
+            description=(
+                "Decode buffered pages straight from the lxml tree instead of "
+                "through xmltodict."
+            ),
+        ),
+        Property(
+            "engine",
+            StringType,
+            default="sync",
+            allowed_values=["sync", "async"],
+            description=(
+                "'async' fetches the pages of all selected streams and divisions "
+                "concurrently on one event loop. Requires httpx."
+            ),
+        ),
+        Property(
+            "async_max_connections",
+            IntegerType,
+            default=8,
+            description="Maximum concurrent connections of the async engine.",
+        ),
+        Property(
+            "async_prefetch_pages",
+            IntegerType,
+            default=2,
+            description="Pages the async engine fetches ahead for each stream and division.",
+        ),
+        Property(
+            "max_concurrent_streams",
+            IntegerType,
+            default=1,
+            description="Number of selected streams synced at the same time.",
+        ),
+        Property(
+            "max_requests_per_minute",
+            IntegerType,
+            description="Requests per minute shared by all streams, on top of Exact's own limit.",
+        ),
+        Property(
+            "quota_reserve",
+            IntegerType,
+            default=0,
+            description=(
+                "Daily requests per division to leave unused, e.g. for intraday "
+                "incremental runs. Streams stop at a page boundary once reached, "
+                "repairs do not."
+            ),
+        ),
+        Property(
+            "preflight_counts",
+            BooleanType,
+            default=False,
+            description=(
+                "Request the row count of each stream and division before syncing, "
+                "for progress logs, quota planning and stream scheduling."
+            ),
+        ),
+        Property(
+            "response_cache_dir",
+            StringType,
+            description="Directory for the HTTP response cache. Caching is off when unset.",
+        ),
+        Property(
+            "response_cache_mode",
+            StringType,
+            default="cache",
+            allowed_values=["cache", "record", "replay"],
+            description=(
+                "'cache' serves unexpired responses, 'record' refreshes every "
+                "response and 'replay' runs only from the cache, without tokens."
+            ),
+        ),
+        Property(
+            "response_cache_ttl",
+            IntegerType,
+            default=86400,
+            description="Seconds a cached response is served in 'cache' mode.",
+        ),
+        Property(
+            "response_cache_max_size",
+            IntegerType,
+            default=1024**3,
+            description="Compressed bytes kept in the response cache before LRU eviction.",
+        ),
+        Property(
+            "source_timezone",
+            StringType,
+            default=DEFAULT_TIMEZONE,
+            description=(
+                "Time zone of the administrations. Exact returns date-times without an "
+                "offset, in this local time, and they are emitted with its UTC offset."
+            ),
+        ),
+        Property(
+            "fingerprint_dir",
+            StringType,
+            description=(
+                "Directory for the row fingerprint index. When set, full-reload "
+                "streams only emit the rows inserted, updated or deleted since the "
+                "run whose state is passed in."
+            ),
+        ),
+        Property(
+            "repair",
+            ObjectType(
+                Property("stream", StringType, required=True),
+                Property(
+                    "divisions",
+                    ArrayType(StringType),
+                    description="Divisions to repair, all configured divisions if not set.",
+                ),
+                Property(
+                    "start",
+                    StringType,
+                    required=True,
+                    description=(
+                        "First Timestamp of the range for sync streams, or first "
+                        "Modified date-time for other streams, inclusive."
+                    ),
+                ),
+                Property(
+                    "end",
+                    StringType,
+                    required=True,
+                    description="Last Timestamp or Modified date-time of the range, inclusive.",
+                ),
+                Property(
+                    "chunks",
+                    IntegerType,
+                    default=4,
+                    description="Slices per division, fetched in parallel.",
+                ),
+            ),
+            description=(
+                "Re-extract only a range of one stream instead of syncing, without "
+                "reading or moving any bookmark."
+            ),
+        ),
     ).to_dict()
 
+    def __init__(self, *args, **kwargs) -> None:
+        # guards stdout and the tap state, which the stream threads share
+        self._write_lock = threading.RLock()
+        super().__init__(*args, **kwargs)
+        if self.config.get("response_cache_mode") == "replay" and (
+            not self.config.get("response_cache_dir") or self.config.get("stream_responses")
+        ):
+            # without a mounted cache, a replay would query the API unauthenticated
+            msg = "Replaying requires response_cache_dir and no stream_responses."
+            raise ConfigValidationError(msg)
+        try:
+            pendulum.timezone(self.config.get("source_timezone", DEFAULT_TIMEZONE))
+        except ValueError as ex:
+            msg = f"Unknown source_timezone '{self.config['source_timezone']}'."
+            raise ConfigValidationError(msg) from ex
+        self.rate_budget = RateBudget(self.config.get("max_requests_per_minute"))
+        self.quota_planner = QuotaPlanner(
+            self.state, self.config.get("quota_reserve", 0), lock=self._write_lock
+        )
+
+    def load_state(self, state: dict) -> None:
+        """Merge the bookmarks of the input state, and carry over the daily quota.
+
+        Args:
+            state: The input state.
+        """
+        super().load_state(state)
+        if "quota" in state:
+            self.state["quota"] = copy.deepcopy(state["quota"])
+
+    def write_message(self, message) -> None:
+        """Write a message to stdout, one at a time when streams run concurrently.
+
+        Args:
+            message: The Singer message.
+        """
+        with self._write_lock:
+            super().write_message(message)
+
     def discover_streams(self) -> list[streams.ExactStream]:
         """Return a list of discovered streams.
 
@@ -45,6 +283,103 @@ class TapExact(Tap):
             streams.SalesInvoicesStream(self),
         ]
 
+    @cached_property
+    def async_engine(self) -> AsyncEngine | None:
+        """Return the async engine, started for every selected stream, if enabled.
+
+        Returns:
+            The engine, or None when using the sync engine.
+        """
+        if self.config.get("engine", "sync") != "async" or self.config.get("repair"):
+            return None
+        if self.config.get("response_cache_dir") or self.config.get("stream_responses"):
+            self.logger.warning(
+                "The async engine does not support the response cache or streamed "
+                "responses, using the sync engine."
+            )
+            return None
+        engine = AsyncEngine(self)
+        engine.start(stream for stream in self.streams.values() if stream.selected)
+        return engine
+
+    def sync_all(self) -> None:  # type: ignore[misc]
+        """Sync all streams, or the repair range, then stop the async engine if it was started.
+
+        ``Tap.sync_all`` is final in the SDK, but it offers no hook to run a
+        repair or to sync streams in parallel. This override, and
+        :meth:`sync_all_concurrently`, which repeats its steps, are tied to
+        singer-sdk 0.35, which ``pyproject.toml`` pins. ``test_scheduler.py`` fails
+        when those steps change.
+        """
+        try:
+            if self.config.get("repair"):
+                self.sync_repair()
+            elif self.config.get("max_concurrent_streams", 1) > 1:
+                self.sync_all_concurrently()
+            else:
+                super().sync_all()
+        finally:
+            if self.__dict__.get("async_engine"):
+                self.async_engine.close()
+
+    def sync_all_concurrently(self) -> None:
+        """Sync the selected streams in parallel, largest first.
+
+        Follows the steps of the SDK's ``Tap.sync_all``, but syncs the streams
+        with :func:`sync_concurrently`. This tap has no child streams.
+        """
+        self._reset_state_progress_markers()
+        self._set_compatible_replication_methods()
+        self.write_message(StateMessage(value=self.state))
+
+        selected = []
+        for stream in self.streams.values():
+            if not stream.selected:
+                self.logger.info("Skipping deselected stream '%s'.", stream.name)
+                continue
+            selected.append(stream)
+
+        # started before the streams, as it is shared between their threads
+        engine = self.async_engine
+        if engine:
+            self.logger.info("Prefetching with the async engine.")
+        sync_concurrently(selected, self.config["max_concurrent_streams"])
+
+        for stream in self.streams.values():
+            stream.log_sync_costs()
+
+    def sync_repair(self) -> None:
+        """Emit the configured repair range of one stream, in parallel slices.
+
+        No STATE message is written, so the bookmarks of the next normal sync
+        are the same as before the repair. With no bookmark to resume from, the
+        slices are fetched in full, past the ``quota_reserve``.
+
+        Raises:
+            ConfigValidationError: If the stream cannot be repaired or the range is invalid.
+        """
+        repair = self.config["repair"]
+        stream = self.streams.get(repair["stream"])
+        if stream is None:
+            msg = f"Cannot repair unknown stream '{repair['stream']}'."
+            raise ConfigValidationError(msg)
+        if stream.repair_key not in stream.schema["properties"]:
+            msg = f"Cannot repair '{stream.name}', it has no {stream.repair_key} property."
+            raise ConfigValidationError(msg)
+
+        divisions = repair.get("divisions") or self.config["divisions"]
+        chunks = repair.get("chunks", 4)
+        try:
+            partitions = stream.repair_partitions(
+                divisions, repair["start"], repair["end"], chunks
+            )
+        except ValueError as ex:
+            msg = f"Invalid repair range for '{stream.name}': {ex}"
+            raise ConfigValidationError(msg) from ex
+        stream._write_schema_message()
+        count = repair_concurrently(stream, partitions, chunks)
+        self.logger.info("Repaired %d rows of '%s'.", count, stream.name)
+
 
 if __name__ == "__main__":
     TapExact.cli()
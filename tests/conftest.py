@@ -1,3 +1,14 @@
 """Test Configuration."""
 
 pytest_plugins = ("singer_sdk.testing.pytest_plugin",)
+
+import pytest
+
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG
+
+
+@pytest.fixture
+def tap() -> TapExact:
+    """Return a tap with the test config."""
+    return TapExact(config=CONFIG, parse_env_config=False)
@@ -0,0 +1,243 @@
+"""Fake Exact feeds and server used by the tests."""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
+import json
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from tap_exact import client
+from tap_exact.tap import TapExact
+
+NAMESPACES = (
+    'xmlns="http://www.w3.org/2005/Atom" '
+    'xmlns:d="http://schemas.microsoft.com/ado/2007/08/dataservices" '
+    'xmlns:m="http://schemas.microsoft.com/ado/2007/08/dataservices/metadata"'
+)
+
+CONFIG = {
+    "client_id": "client-id",
+    "client_secret": "client-secret",
+    "azure_connection_string": "connection-string",
+    "blob_storage_path": "tokens.json",
+    "divisions": ["1", "2"],
+    "start_date": "2020-01-01T00:00:00Z",
+}
+
+HEADERS = {
+    "X-RateLimit-Minutely-Remaining": "50",
+    "X-RateLimit-Remaining": "1000",
+    "X-RateLimit-Reset": "0",
+}
+
+
+def build_entry(properties: dict) -> str:
+    """Build an Atom entry.
+
+    Args:
+        properties: Property name to a text, a ``(text, m:type)`` pair, or None.
+
+    Returns:
+        The entry XML.
+    """
+    elements = []
+    for name, value in properties.items():
+        if value is None:
+            elements.append(f'<d:{name} m:null="true" />')
+        elif isinstance(value, tuple):
+            elements.append(f'<d:{name} m:type="{value[1]}">{value[0]}</d:{name}>')
+        else:
+            elements.append(f"<d:{name}>{value}</d:{name}>")
+    return (
+        '<entry><content type="application/xml"><m:properties>'
+        f"{''.join(elements)}</m:properties></content></entry>"
+    )
+
+
+def build_feed(entries: list[dict], next_link: str | None = None) -> bytes:
+    """Build an Atom feed page.
+
+    Args:
+        entries: The properties of each entry.
+        next_link: The link to the next page, if any.
+
+    Returns:
+        The feed XML.
+    """
+    links = '<link rel="self" href="self" />'
+    if next_link:
+        links += f'<link rel="next" href="{next_link}" />'
+    body = "".join(build_entry(entry) for entry in entries)
+    return f'<?xml version="1.0" encoding="utf-8"?><feed {NAMESPACES}>{body}{links}</feed>'.encode()
+
+
+def build_response(
+    body: bytes,
+    url: str = "https://start.exactonline.nl/api/v1/1/sync/Financial/TransactionLines",
+    status: int = 200,
+    headers: dict | None = None,
+) -> requests.Response:
+    """Build a requests response.
+
+    Args:
+        body: The response body.
+        url: The request URL.
+        status: The status code.
+        headers: The response headers.
+
+    Returns:
+        The response.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(body)
+    response.headers.update(HEADERS if headers is None else headers)
+    response.url = url
+    return response
+
+
+def fake_entry(division: str, page: int, row: int) -> dict:
+    """Return the properties of a row of the fake server.
+
+    Args:
+        division: The Exact division.
+        page: The page number.
+        row: The row number within the page.
+
+    Returns:
+        The entry properties.
+    """
+    return {
+        "ID": f"{division}-{page}-{row}",
+        "EntryID": f"{division}-{page}-{row}",
+        "Division": (division, "Edm.Int32"),
+        "Timestamp": (str(page * 10 + row + 2), "Edm.Int64"),
+        "Modified": (f"2024-01-0{row + 1}T03:04:05.123", "Edm.DateTime"),
+        "Date": ("2024-01-01T00:00:00", "Edm.DateTime"),
+        "AmountDC": (f"{page}.{row}5", "Edm.Double"),
+        "ExchangeRate": (f"1.{row}00", "Edm.Decimal"),
+        "Description": f"Line {row}",
+        "Notes": None,
+        "ReportingCode": "RC",
+        "Blocked": ("false", "Edm.Boolean"),
+    }
+
+
+class FakeExact:
+    """Serve every stream and division as a few pages of generated rows.
+
+    Attributes:
+        urls: The URL of every request received.
+    """
+
+    def __init__(self, pages: int = 3, rows: int = 3) -> None:
+        self.pages = pages
+        self.rows = rows
+        self.urls: list[str] = []
+
+    def page(self, url: str) -> bytes:
+        """Return the page of a request URL.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            The page body, or the row count for a ``$count`` request.
+        """
+        self.urls.append(url)
+        parsed = urlparse(url)
+        division = parsed.path.split("/")[3]
+        if parsed.path.endswith("/$count"):
+            return str(self.pages * self.rows).encode()
+        page = int(parse_qs(parsed.query).get("$skiptoken", ["0"])[0])
+        next_link = None
+        if page < self.pages - 1:
+            next_link = f"{url.split('?')[0]}?$skiptoken={page + 1}"
+        entries = [fake_entry(division, page, row) for row in range(self.rows)]
+        return build_feed(entries, next_link)
+
+    def send(self, adapter, request: requests.PreparedRequest, **kwargs) -> requests.Response:  # noqa: ARG002
+        """Stand in for ``HTTPAdapter.send``."""
+        response = build_response(self.page(request.url), url=request.url)
+        response.request = request
+        return response
+
+    def handler(self, request):
+        """Handle an httpx request, for ``httpx.MockTransport``."""
+        import httpx
+
+        return httpx.Response(200, content=self.page(str(request.url)), headers=HEADERS)
+
+
+def run_tap(
+    config: dict,
+    streams: tuple[str, ...],
+    server: FakeExact | None = None,
+    state: dict | None = None,
+) -> list[dict]:
+    """Run a sync against the fake server and return the Singer messages.
+
+    Args:
+        config: Settings on top of the test config.
+        streams: Names of the selected streams.
+        server: The fake server, a new one by default.
+        state: The input state, if any.
+
+    Returns:
+        The messages, without their extraction time.
+    """
+    server = server or FakeExact()
+    output = io.StringIO()
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch.object(client.ExactStream, "authenticator", None))
+        stack.enter_context(
+            mock.patch("requests.adapters.HTTPAdapter.send", autospec=True, side_effect=server.send)
+        )
+        if config.get("engine") == "async":
+            import httpx
+
+            from tap_exact import engine
+
+            init = engine.AsyncEngine.__init__
+            transport = httpx.MockTransport(server.handler)
+            stack.enter_context(
+                mock.patch.object(
+                    engine.AsyncEngine,
+                    "__init__",
+                    lambda self, tap: init(self, tap, transport=transport),
+                )
+            )
+        stack.enter_context(contextlib.redirect_stdout(output))
+        tap = TapExact(
+            config={**CONFIG, **config}, state=copy.deepcopy(state), parse_env_config=False
+        )
+        for name, stream in tap.streams.items():
+            stream.selected = name in streams
+        tap.sync_all()
+
+    messages = [json.loads(line) for line in output.getvalue().splitlines()]
+    for message in messages:
+        message.pop("time_extracted", None)
+    return messages
+
+
+def by_stream(messages: list[dict]) -> tuple[dict, dict]:
+    """Split interleaved output into the records of each stream and the final state.
+
+    Args:
+        messages: Messages as returned by :func:`run_tap`.
+
+    Returns:
+        The records of each stream, in order, and the value of the last STATE.
+    """
+    records: dict[str, list] = {}
+    for message in messages:
+        if message["type"] == "RECORD":
+            records.setdefault(message["stream"], []).append(message["record"])
+    states = [message["value"] for message in messages if message["type"] == "STATE"]
+    return records, states[-1]
@@ -0,0 +1,157 @@
+"""Tests for the HTTP response cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from unittest import mock
+
+import pytest
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_exact.cache import CacheMissError, ResponseCache
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, FakeExact
+
+
+def test_response_round_trip(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60, max_size=1024)
+    cache.set("url", 200, {"Content-Type": "application/xml"}, b"body")
+
+    assert cache.get("url") == (200, {"Content-Type": "application/xml"}, b"body")
+    assert cache.get("other") is None
+
+
+def test_expired_responses_are_only_served_in_replay(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60, max_size=1024)
+    cache.set("url", 200, {}, b"body")
+
+    with mock.patch("time.time", return_value=time.time() + 61):
+        assert cache.get("url") is None
+        assert cache.get("url", ignore_ttl=True) == (200, {}, b"body")
+
+
+def test_least_recently_used_responses_are_evicted(tmp_path):
+    body = os.urandom(1024)
+    cache = ResponseCache(str(tmp_path), ttl=60, max_size=2 * len(body) + 200)
+    with mock.patch("time.time", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0]):
+        cache.set("first", 200, {}, body)
+        cache.set("second", 200, {}, body)
+        cache.get("first")
+        cache.set("third", 200, {}, body)
+
+    assert cache.get("second", ignore_ttl=True) is None
+    assert cache.get("first", ignore_ttl=True) is not None
+    assert cache.get("third", ignore_ttl=True) is not None
+
+
+class TruncatingExact(FakeExact):
+    """Send a truncated first page, then valid ones."""
+
+    def page(self, url: str) -> bytes:
+        body = super().page(url)
+        return body[:-100] if len(self.urls) == 1 else body
+
+
+def sync(config: dict, server: FakeExact) -> list[dict]:
+    tap = TapExact(config={**CONFIG, **config}, parse_env_config=False)
+    stream = tap.streams["transaction_lines"]
+    with mock.patch.object(type(stream), "authenticator", None), mock.patch(
+        "requests.adapters.HTTPAdapter.send", autospec=True, side_effect=server.send
+    ):
+        return list(stream.request_records({"division": "1"}))
+
+
+@pytest.fixture
+def config(tmp_path):
+    return {"response_cache_dir": str(tmp_path), "backoff_factor": 0}
+
+
+def test_invalid_pages_are_not_cached(config):
+    server = TruncatingExact()
+
+    records = sync(config, server)
+
+    assert len(records) == 9
+    assert len(server.urls) == 4
+    replayed = sync({**config, "response_cache_mode": "replay"}, FakeExact())
+    assert replayed == records
+
+
+def test_invalid_cached_pages_are_evicted_and_fetched_again(config):
+    sync(config, FakeExact())
+    tap = TapExact(config={**CONFIG, **config}, parse_env_config=False)
+    cache = tap.streams["transaction_lines"].response_cache.cache
+    first_url = cache.connection.execute("SELECT url FROM responses ORDER BY created").fetchone()[0]
+    status, headers, body = cache.get(first_url)
+    cache.set(first_url, status, headers, body[:-100])
+    server = FakeExact()
+
+    assert len(sync(config, server)) == 9
+    assert server.urls == [first_url]
+    assert cache.get(first_url)[2] == body
+
+
+def test_replay_fails_on_a_miss(config):
+    with pytest.raises(CacheMissError):
+        sync({**config, "response_cache_mode": "replay"}, FakeExact())
+
+
+def test_rate_limit_headers_are_not_cached(config):
+    sync(config, FakeExact())
+    tap = TapExact(config={**CONFIG, **config}, parse_env_config=False)
+    cache = tap.streams["transaction_lines"].response_cache.cache
+    (url,) = cache.connection.execute("SELECT url FROM responses LIMIT 1").fetchone()
+
+    assert not any(key.lower().startswith("x-ratelimit") for key in cache.get(url)[1])
+
+
+def count(config: dict, server: FakeExact) -> int | None:
+    tap = TapExact(
+        config={**CONFIG, **config, "preflight_counts": True}, parse_env_config=False
+    )
+    stream = tap.streams["transaction_lines"]
+    with mock.patch.object(type(stream), "authenticator", None), mock.patch(
+        "requests.adapters.HTTPAdapter.send", autospec=True, side_effect=server.send
+    ):
+        return stream.row_count({"division": "1"})
+
+
+def test_row_counts_are_not_served_from_the_cache(config):
+    server = FakeExact()
+    assert count(config, server) == 9
+    cache = TapExact(config={**CONFIG, **config}, parse_env_config=False).streams[
+        "transaction_lines"
+    ].response_cache.cache
+    cache.set(server.urls[0], 200, {}, b"5")
+    server = FakeExact(pages=4)
+
+    assert count(config, server) == 12
+    assert "/$count?" in server.urls[0]
+
+
+def test_row_counts_are_not_requested_in_replay(config):
+    sync(config, FakeExact())
+    server = FakeExact()
+
+    assert count({**config, "response_cache_mode": "replay"}, server) is None
+    assert server.urls == []
+
+
+def test_replay_authenticates_without_tokens(config):
+    tap = TapExact(
+        config={**CONFIG, **config, "response_cache_mode": "replay"}, parse_env_config=False
+    )
+
+    assert tap.streams["transaction_lines"].authenticator is None
+
+
+@pytest.mark.parametrize(
+    "config",
+    [{}, {"response_cache_dir": "cache", "stream_responses": True}],
+)
+def test_replay_without_a_mounted_cache_is_a_config_error(config):
+    with pytest.raises(ConfigValidationError, match="response_cache_dir"):
+        TapExact(
+            config={**CONFIG, **config, "response_cache_mode": "replay"}, parse_env_config=False
+        )
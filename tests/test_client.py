@@ -0,0 +1,100 @@
+"""Tests for page validation and the retry policy of the Exact streams."""
+
+from __future__ import annotations
+
+import time
+from unittest import mock
+
+import pytest
+import requests
+from singer_sdk.exceptions import RetriableAPIError
+
+from tap_exact.client import InvalidPageError
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, build_feed, build_response, fake_entry
+
+
+@pytest.fixture
+def stream(tap):
+    return tap.streams["transaction_lines"]
+
+
+def test_validate_page_accepts_complete_page(stream):
+    response = build_response(build_feed([fake_entry("1", 0, row) for row in range(3)]))
+
+    stream.validate_page(response)
+
+
+def test_validate_page_rejects_truncated_page(stream):
+    body = build_feed([fake_entry("1", 0, row) for row in range(3)])
+    response = build_response(body[: len(body) // 2])
+
+    with pytest.raises(InvalidPageError, match="Truncated"):
+        stream.validate_page(response)
+
+
+def test_validate_page_rejects_lost_entries(stream):
+    response = build_response(build_feed([fake_entry("1", 0, row) for row in range(3)]))
+
+    with pytest.raises(InvalidPageError, match="expected 3 entries but parsed 2"):
+        stream.validate_page(response, parsed=2)
+
+
+def test_validate_response_retries_invalid_page(stream):
+    body = build_feed([fake_entry("1", 0, 0)])
+    response = build_response(body[:-20])
+
+    with pytest.raises(RetriableAPIError):
+        stream.validate_response(response)
+
+
+def test_retry_waits_grow_exponentially_up_to_max():
+    config = {**CONFIG, "backoff_factor": 2, "backoff_max_wait": 10}
+    stream = TapExact(config=config, parse_env_config=False).streams["transaction_lines"]
+    waits = stream.backoff_wait_generator()
+    next(waits)
+
+    error = RetriableAPIError("error")
+    assert [waits.send(error) for _ in range(5)] == [2, 4, 8, 10, 10]
+
+
+def test_retry_waits_until_rate_limit_resets(stream):
+    reset = int((time.time() + 30) * 1000)
+    response = build_response(
+        b"",
+        status=429,
+        headers={"X-RateLimit-Minutely-Remaining": "0", "X-RateLimit-Minutely-Reset": str(reset)},
+    )
+    waits = stream.backoff_wait_generator()
+    next(waits)
+
+    assert 25 < waits.send(RetriableAPIError("rate limited", response)) <= 30
+
+
+def test_unauthorized_invalidates_token_and_retries(stream):
+    authenticator = mock.Mock()
+    stream.__dict__["authenticator"] = authenticator
+
+    with pytest.raises(RetriableAPIError):
+        stream.validate_response(build_response(b"", status=401))
+    authenticator.invalidate_access_token.assert_called_once()
+
+
+def test_retry_is_sent_with_fresh_auth_headers(stream):
+    authenticator = mock.Mock(auth_headers={"Authorization": "Bearer new"})
+    stream.__dict__["authenticator"] = authenticator
+    request = requests.Request("GET", "https://example.com").prepare()
+    request.headers["Authorization"] = "Bearer old"
+
+    stream.backoff_handler(
+        {
+            "args": (request, {"division": "1"}),
+            "exception": RetriableAPIError("error", build_response(b"", status=401)),
+            "tries": 1,
+            "wait": 0,
+            "target": stream._request,
+            "elapsed": 0,
+        }
+    )
+
+    assert request.headers["Authorization"] == "Bearer new"
@@ -0,0 +1,102 @@
+"""Tests for the pre-flight row counts."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from tap_exact.client import ExactStream
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, FakeExact, build_response
+
+
+class CountingExact(FakeExact):
+    """Answer ``$count`` requests with the given statuses first, then with the count."""
+
+    def __init__(self, *statuses: int) -> None:
+        super().__init__()
+        self.statuses = list(statuses)
+
+    def send(self, adapter, request, **kwargs):
+        if "/$count" in request.url and self.statuses:
+            self.urls.append(request.url)
+            response = build_response(b"error", url=request.url, status=self.statuses.pop(0))
+            response.request = request
+            return response
+        return super().send(adapter, request, **kwargs)
+
+
+@pytest.fixture
+def stream():
+    config = {**CONFIG, "preflight_counts": True, "backoff_factor": 0}
+    stream = TapExact(config=config, parse_env_config=False).streams["sales_entries"]
+    stream.__dict__["authenticator"] = None
+    with mock.patch.object(ExactStream, "backoff_jitter", lambda self, value: value):
+        yield stream
+
+
+def count(stream, server: FakeExact, division: str = "1") -> int | None:
+    with mock.patch("requests.adapters.HTTPAdapter.send", autospec=True, side_effect=server.send):
+        return stream.row_count({"division": division})
+
+
+def test_count_is_requested_once_per_partition(stream):
+    server = FakeExact()
+
+    assert count(stream, server) == 9
+    assert count(stream, server) == 9
+    assert len(server.urls) == 1
+
+
+@pytest.mark.parametrize("status", [400, 404, 501])
+def test_unsupported_counts_are_turned_off(stream, status):
+    server = CountingExact(status)
+
+    assert count(stream, server) is None
+    assert count(stream, server, "2") is None
+    assert len(server.urls) == 1
+    assert not stream.supports_count
+
+
+def test_transient_failures_are_retried(stream):
+    server = CountingExact(503, 429)
+
+    assert count(stream, server) == 9
+    assert len(server.urls) == 3
+
+
+def test_failed_count_only_skips_its_partition(stream):
+    server = CountingExact(*[503] * stream.backoff_max_tries(), 403)
+
+    assert count(stream, server) is None
+    assert count(stream, server) is None
+    assert count(stream, server, "2") is None
+    assert count(stream, server, "3") == 9
+    assert stream.supports_count
+
+
+def test_unauthorized_count_is_retried_with_a_new_token(stream):
+    authenticator = mock.Mock(auth_headers={"Authorization": "Bearer new"})
+    stream.__dict__["authenticator"] = authenticator
+
+    assert count(stream, CountingExact(401)) == 9
+    authenticator.invalidate_access_token.assert_called_once()
+
+
+def test_counts_size_streams(stream):
+    assert count(stream, FakeExact()) == 9
+    assert count(stream, FakeExact(pages=1), "2") == 3
+
+    assert stream.estimate_size() == 12
+
+
+def test_counts_decide_admission(stream):
+    count(stream, FakeExact(pages=2, rows=stream.page_size))
+    count(stream, FakeExact(pages=1, rows=stream.page_size), "2")
+    stream._tap.quota_planner.divisions["1"] = {"remaining": 1, "reset": 2**50}
+    stream._tap.quota_planner.divisions["2"] = {"remaining": 1, "reset": 2**50}
+
+    # two pages do not fit in the one request left, one page does
+    assert not stream.admit({"division": "1"})
+    assert stream.admit({"division": "2"})
@@ -0,0 +1,130 @@
+"""Tests for the asyncio extraction engine."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from tap_exact.client import ExactStream
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, HEADERS, FakeExact, build_response, by_stream, run_tap
+
+httpx = pytest.importorskip("httpx")
+
+from tap_exact.engine import AsyncEngine  # noqa: E402
+
+STREAMS = ("transaction_lines", "gl_classifications", "sales_entries")
+
+
+class FlakyExact(FakeExact):
+    """Fail the first request of every page with a 503."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failed: set[str] = set()
+
+    def fails(self, url: str) -> bool:
+        if url in self.failed:
+            return False
+        self.failed.add(url)
+        return True
+
+    def send(self, adapter, request, **kwargs):
+        if self.fails(request.url):
+            response = build_response(b"unavailable", url=request.url, status=503)
+            response.request = request
+            return response
+        return super().send(adapter, request, **kwargs)
+
+    def handler(self, request):
+        if self.fails(str(request.url)):
+            return httpx.Response(503, content=b"unavailable", headers=HEADERS)
+        return super().handler(request)
+
+
+def test_async_engine_output_matches_sync_engine():
+    assert run_tap({"engine": "async"}, STREAMS) == run_tap({}, STREAMS)
+
+
+def test_async_engine_output_matches_sync_engine_with_retries():
+    config = {"backoff_factor": 0}
+    flaky = FlakyExact()
+
+    with mock.patch.object(ExactStream, "backoff_jitter", lambda self, value: value):
+        expected = run_tap(config, STREAMS, FlakyExact())
+        assert run_tap({**config, "engine": "async"}, STREAMS, flaky) == expected
+    assert flaky.failed
+
+
+def test_async_engine_output_matches_sync_engine_with_counts():
+    config = {"preflight_counts": True}
+
+    assert run_tap({**config, "engine": "async"}, STREAMS) == run_tap(config, STREAMS)
+
+
+def test_async_engine_counts_retries():
+    jitter = mock.patch.object(ExactStream, "backoff_jitter", lambda self, value: value)
+    with jitter, mock.patch.object(ExactStream, "log_retry", autospec=True) as log_retry:
+        run_tap({"backoff_factor": 0, "engine": "async"}, ("gl_classifications",), FlakyExact())
+
+    contexts = [call.args[1] for call in log_retry.call_args_list]
+    assert contexts.count({"division": "1"}) == 3
+    assert contexts.count({"division": "2"}) == 3
+
+
+def test_async_engine_acquires_the_rate_budget():
+    with mock.patch("tap_exact.scheduler.RateBudget.acquire", autospec=True) as acquire:
+        messages = run_tap({"engine": "async"}, ("gl_classifications",))
+
+    records = [message for message in messages if message["type"] == "RECORD"]
+    assert len(records) == 18
+    assert acquire.call_count == 6
+
+
+def test_async_engine_output_matches_sync_engine_concurrently():
+    config = {"max_concurrent_streams": 3}
+
+    assert by_stream(run_tap({**config, "engine": "async"}, STREAMS)) == by_stream(
+        run_tap(config, STREAMS)
+    )
+
+
+def test_partitions_over_quota_are_not_prefetched():
+    server = FakeExact()
+    tap = TapExact(config={**CONFIG, "engine": "async"}, parse_env_config=False)
+    tap.quota_planner.divisions["2"] = {"remaining": 5, "reset": 2**50}
+    tap.quota_planner.requests["sales_entries"] = {"2": 10}
+    stream = tap.streams["sales_entries"]
+    for name, other in tap.streams.items():
+        other.selected = name == stream.name
+
+    transport = httpx.MockTransport(server.handler)
+    init = AsyncEngine.__init__
+    with mock.patch.object(ExactStream, "authenticator", None), mock.patch.object(
+        AsyncEngine, "__init__", lambda engine, tap: init(engine, tap, transport)
+    ):
+        engine = tap.async_engine
+    try:
+        skipped = list(stream.get_records({"division": "2"}))
+        synced = list(stream.get_records({"division": "1"}))
+    finally:
+        engine.close()
+
+    assert skipped == []
+    assert len(synced) == 9
+    assert not any("/2/" in url for url in server.urls)
+
+
+def test_token_is_refreshed_through_the_authenticator_lock():
+    tap = TapExact(config=CONFIG, parse_env_config=False)
+    engine = AsyncEngine(tap, transport=httpx.MockTransport(FakeExact().handler))
+    authenticator = mock.Mock(access_token="fresh")
+    authenticator.is_token_valid.return_value = False
+    try:
+        assert engine._run(engine._access_token(authenticator)) == "fresh"
+    finally:
+        engine.close()
+
+    authenticator.update_access_token.assert_called_once_with()
+
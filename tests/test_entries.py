@@ -0,0 +1,106 @@
+"""Tests for decoding entries straight from the lxml tree."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from lxml import etree
+
+from tap_exact.entries import ATOM, decode_entries
+from tests.fakes import build_feed, build_response, fake_entry, run_tap
+
+SCHEMA = {
+    "properties": {
+        "ID": {"type": ["string", "null"]},
+        "Amount": {"type": ["number", "null"]},
+        "Rate": {"type": ["number", "null"]},
+        "Code": {"type": ["boolean", "null"]},
+        "Modified": {"type": ["string", "null"], "format": "date-time"},
+        "Mixed": {"type": ["string", "null"]},
+        "Missing": {"type": ["string", "null"]},
+        "_sdc_deleted_at": {"type": ["string", "null"]},
+    }
+}
+
+ENTRIES = [
+    {
+        "ID": " a ",
+        "Amount": ("1.5", "Edm.Double"),
+        "Rate": ("1.10", "Edm.Decimal"),
+        "Code": "R1",
+        "Modified": ("2024-01-02T03:04:05", "Edm.DateTime"),
+        "Mixed": ("7", "Edm.Int32"),
+        "Extra": "x",
+    },
+    {
+        "ID": "b",
+        "Amount": None,
+        "Rate": ("2", "Edm.Decimal"),
+        "Code": "",
+        "Modified": None,
+        "Mixed": "text",
+    },
+]
+
+
+def entries_of(body: bytes) -> list:
+    return etree.fromstring(body).findall(f"{ATOM}entry")
+
+
+@pytest.fixture
+def stream(tap):
+    return tap.streams["transaction_lines"]
+
+
+def row_path(stream, body: bytes) -> list[dict]:
+    response = build_response(body)
+    return [stream.post_process(row) for row in stream.parse_response(response)]
+
+
+def test_values_are_converted_by_their_edm_type(stream):
+    body = build_feed(ENTRIES)
+
+    rows = list(decode_entries(entries_of(body), SCHEMA))
+
+    assert rows == [
+        {
+            "ID": "a",
+            "Amount": 1.5,
+            "Rate": Decimal("1.10"),
+            "Code": "R1",
+            "Modified": "2024-01-02T03:04:05+01:00",
+            "Mixed": 7,
+        },
+        {
+            "ID": "b",
+            "Amount": None,
+            "Rate": Decimal("2"),
+            "Code": None,
+            "Modified": None,
+            "Mixed": "text",
+        },
+    ]
+    assert rows == [
+        {key: value for key, value in row.items() if key in SCHEMA["properties"]}
+        for row in row_path(stream, body)
+    ]
+
+
+def test_decoded_entries_match_row_path(stream):
+    body = build_feed([fake_entry("1", 0, row) for row in range(3)])
+
+    rows = list(decode_entries(entries_of(body), stream.schema))
+
+    assert rows == [
+        {key: value for key, value in row.items() if key in stream.schema["properties"]}
+        for row in row_path(stream, body)
+    ]
+
+
+@pytest.mark.parametrize(
+    "streams",
+    [("transaction_lines", "sales_invoices"), ("gl_accounts", "sales_entries")],
+)
+def test_lxml_sync_matches_row_sync(streams):
+    assert run_tap({"lxml_pages": True}, streams) == run_tap({}, streams)
@@ -0,0 +1,132 @@
+"""Tests for the row fingerprint index."""
+
+from __future__ import annotations
+
+import pytest
+
+from tap_exact.fingerprints import FingerprintIndex
+from tests.fakes import CONFIG, FakeExact, run_tap
+
+ROWS = [
+    {"ID": "a", "Division": 1, "Amount": 1.0},
+    {"ID": "b", "Division": 1, "Amount": 2.0},
+    {"ID": "c", "Division": 1, "Amount": 3.0},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    return FingerprintIndex(str(tmp_path), "stream", ["ID", "Division"])
+
+
+def sync(index, rows, baseline=None, division="1"):
+    with index.partition(division, baseline) as partition:
+        changed = [row["ID"] for row in rows if partition.changed(row)]
+        removed = list(partition.removed())
+    return changed, removed, partition.generation
+
+
+def test_first_run_emits_every_row(index):
+    assert sync(index, ROWS) == (["a", "b", "c"], [], 1)
+
+
+def test_unchanged_rows_are_suppressed(index):
+    *_, generation = sync(index, ROWS)
+
+    assert sync(index, ROWS, generation) == ([], [], 2)
+
+
+def test_updated_and_inserted_rows_are_emitted(index):
+    *_, generation = sync(index, ROWS)
+    rows = [ROWS[0], {**ROWS[1], "Amount": 5.0}, ROWS[2], {"ID": "d", "Division": 1}]
+
+    assert sync(index, rows, generation)[0] == ["b", "d"]
+
+
+def test_missing_rows_are_emitted_as_deleted(index):
+    *_, generation = sync(index, ROWS)
+
+    changed, removed, generation = sync(index, ROWS[:2], generation)
+
+    assert changed == []
+    assert [{key: row[key] for key in ("ID", "Division")} for row in removed] == [
+        {"ID": "c", "Division": 1}
+    ]
+    assert removed[0]["_sdc_deleted_at"]
+    assert sync(index, ROWS[:2], generation)[:2] == ([], [])
+
+
+def test_divisions_are_independent(index):
+    *_, generation = sync(index, ROWS, division="1")
+
+    assert sync(index, ROWS[:1], division="2")[:2] == (["a"], [])
+    assert sync(index, ROWS, generation, division="1")[:2] == ([], [])
+
+
+def test_failed_run_is_rolled_back(index):
+    *_, generation = sync(index, ROWS)
+    changed_row = {**ROWS[0], "Amount": 9.0}
+
+    with pytest.raises(RuntimeError), index.partition("1", generation) as partition:
+        assert partition.changed(changed_row)
+        raise RuntimeError
+
+    assert sync(index, [changed_row, *ROWS[1:]], generation)[0] == ["a"]
+
+
+def test_uncommitted_generation_is_diffed_again(index):
+    *_, generation = sync(index, ROWS)
+    rows = [{**ROWS[0], "Amount": 9.0}, ROWS[1]]
+    # the target never committed the state of this run
+    sync(index, rows, generation)
+
+    changed, removed, _ = sync(index, rows, generation)
+
+    assert changed == ["a"]
+    assert [row["ID"] for row in removed] == ["c"]
+
+
+def test_stopped_run_keeps_unseen_rows(index):
+    *_, generation = sync(index, ROWS)
+    with index.partition("1", generation) as partition:
+        partition.changed(ROWS[0])
+        partition.keep_unseen()
+
+    assert sync(index, ROWS, partition.generation)[:2] == ([], [])
+
+
+class ChangingExact(FakeExact):
+    """Serve a different description for every row on the second run."""
+
+    def __init__(self, description: str) -> None:
+        super().__init__()
+        self.description = description
+
+    def page(self, url: str) -> bytes:
+        return super().page(url).replace(b"Line ", self.description.encode())
+
+
+def fingerprint_run(config: dict, server: FakeExact, state: dict) -> tuple[list, dict]:
+    messages = run_tap(config, ("sales_entries",), server, state=state)
+    records = [message["record"] for message in messages if message["type"] == "RECORD"]
+    states = [message["value"] for message in messages if message["type"] == "STATE"]
+    return records, states[-1]
+
+
+def test_rows_are_emitted_until_the_target_commits_their_state(tmp_path):
+    config = {**CONFIG, "fingerprint_dir": str(tmp_path), "divisions": ["1"]}
+    records, committed = fingerprint_run(config, FakeExact(), {})
+    assert len(records) == 9
+
+    # run 2 changes every row, but the target fails and never commits its state
+    records, _ = fingerprint_run(config, ChangingExact("Row "), committed)
+    assert len(records) == 9
+
+    # run 3 starts from the state run 1 committed, and emits the changes again
+    records, committed = fingerprint_run(config, ChangingExact("Row "), committed)
+    assert len(records) == 9
+    assert all(record["Description"].startswith("Row ") for record in records)
+
+    # once run 3's state is committed, the rows are unchanged
+    records, _ = fingerprint_run(config, ChangingExact("Row "), committed)
+    assert records == []
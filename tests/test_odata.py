@@ -0,0 +1,97 @@
+"""Tests for the conversion of OData values."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pendulum
+import pytest
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_exact.odata import EDM_CONVERTERS, _parse_date, edm_converters, parse_datetime
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, by_stream, run_tap
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("2024-01-02T00:00:00", "2024-01-02T00:00:00+01:00"),
+        ("2024-01-02T03:04:05", "2024-01-02T03:04:05+01:00"),
+        ("2024-01-02T03:04:05.000", "2024-01-02T03:04:05+01:00"),
+        ("2024-01-02T03:04:05.1", "2024-01-02T03:04:05.100000+01:00"),
+        ("2024-01-02T03:04:05.123", "2024-01-02T03:04:05.123000+01:00"),
+        ("2024-01-02T03:04:05.1234567", "2024-01-02T03:04:05.123456+01:00"),
+        ("2024-07-02T03:04:05", "2024-07-02T03:04:05+02:00"),
+        ("2024-03-31T01:59:59", "2024-03-31T01:59:59+01:00"),
+        ("2024-03-31T03:00:00", "2024-03-31T03:00:00+02:00"),
+        ("2024-03-31T02:30:00", "2024-03-31T03:30:00+02:00"),
+        ("2024-10-27T02:30:00.5", "2024-10-27T02:30:00.500000+01:00"),
+        ("2024-10-27T03:00:00", "2024-10-27T03:00:00+01:00"),
+        ("2024-01-02T03:04:05Z", "2024-01-02T03:04:05+00:00"),
+        ("2024-01-02T03:04:05.5+02:00", "2024-01-02T03:04:05.500000+02:00"),
+        ("2024-01-02", "2024-01-02T00:00:00+01:00"),
+        ("2024-07-02", "2024-07-02T00:00:00+02:00"),
+    ],
+)
+def test_parse_datetime_matches_pendulum(text, expected):
+    assert parse_datetime(text) == expected
+    assert parse_datetime(text) == pendulum.parse(text, tz="Europe/Amsterdam").isoformat()
+
+
+@pytest.mark.parametrize(
+    ("text", "timezone", "expected"),
+    [
+        ("2024-01-02T03:04:05.123", "UTC", "2024-01-02T03:04:05.123000+00:00"),
+        ("2024-07-02", "UTC", "2024-07-02T00:00:00+00:00"),
+        ("2024-07-02T03:04:05", "America/New_York", "2024-07-02T03:04:05-04:00"),
+        ("2024-01-02T03:04:05Z", "America/New_York", "2024-01-02T03:04:05+00:00"),
+    ],
+)
+def test_naive_values_take_the_offset_of_the_timezone(text, timezone, expected):
+    assert parse_datetime(text, timezone) == expected
+    assert parse_datetime(text, timezone) == pendulum.parse(text, tz=timezone).isoformat()
+
+
+def test_midnight_dates_are_cached():
+    _parse_date.cache_clear()
+
+    parse_datetime("2024-03-01T00:00:00")
+    parse_datetime("2024-03-01T00:00:00")
+    parse_datetime("2024-03-01T12:00:00")
+
+    parse_datetime("2024-03-01T00:00:00", "UTC")
+
+    assert _parse_date.cache_info().hits == 1
+    assert _parse_date.cache_info().currsize == 2
+
+
+def test_edm_converters():
+    assert EDM_CONVERTERS["Edm.Decimal"]("1.10") == Decimal("1.10")
+    assert EDM_CONVERTERS["Edm.Int64"]("42") == 42
+    assert EDM_CONVERTERS["Edm.Double"]("0.5") == 0.5
+    assert EDM_CONVERTERS["Edm.Boolean"]("true") is True
+    assert EDM_CONVERTERS["Edm.Boolean"]("false") is False
+    assert EDM_CONVERTERS["Edm.DateTime"]("2024-01-02T03:04:05") == "2024-01-02T03:04:05+01:00"
+    assert edm_converters("UTC")["Edm.DateTime"]("2024-01-02T03:04:05") == (
+        "2024-01-02T03:04:05+00:00"
+    )
+    assert edm_converters("UTC")["Edm.Decimal"] is EDM_CONVERTERS["Edm.Decimal"]
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [
+        ({}, "2024-01-01T03:04:05.123000+01:00"),
+        ({"source_timezone": "UTC"}, "2024-01-01T03:04:05.123000+00:00"),
+    ],
+)
+def test_records_are_read_in_the_source_timezone(config, expected):
+    records, _ = by_stream(run_tap({**config, "divisions": ["1"]}, ("sales_entries",)))
+
+    assert records["sales_entries"][0]["Modified"] == expected
+
+
+def test_unknown_source_timezone_is_a_config_error():
+    with pytest.raises(ConfigValidationError, match="source_timezone"):
+        TapExact(config={**CONFIG, "source_timezone": "Mars/Olympus"}, parse_env_config=False)
@@ -0,0 +1,38 @@
+"""Tests for the partition progress logs."""
+
+from __future__ import annotations
+
+import logging
+from unittest import mock
+
+from tap_exact.progress import ProgressTracker
+
+
+def track(total: int | None, rows: int, times: list[float]) -> list[str]:
+    logger = mock.Mock(spec=logging.Logger)
+    with mock.patch("tap_exact.progress.time.monotonic", side_effect=times):
+        tracker = ProgressTracker(logger, "1", total, interval=60)
+        list(tracker.track({"ID": row} for row in range(rows)))
+    return [call.args[0] % call.args[1:] for call in logger.info.call_args_list]
+
+
+def test_known_total_logs_percentage_and_eta():
+    # started at 0, then one reading per row and one at the end
+    logs = track(100, 2, [0, 30, 60, 60])
+
+    assert logs == [
+        "Division 1: 2.0% (2/100 rows), 0 rows/sec, ETA 0:49:00",
+        "Division 1: 2.0% (2/100 rows), 0 rows/sec, ETA 0:49:00",
+    ]
+
+
+def test_finished_partition_has_no_eta():
+    logs = track(2, 2, [0, 1, 2, 4])
+
+    assert logs == ["Division 1: 100.0% (2/2 rows), 0 rows/sec, ETA 0:00:00"]
+
+
+def test_unknown_total_logs_rows_and_rate():
+    logs = track(None, 3, [0, 1, 2, 3, 3])
+
+    assert logs == ["Division 1: 3 rows, 1 rows/sec"]
@@ -0,0 +1,95 @@
+"""Tests for the daily quota planner."""
+
+from __future__ import annotations
+
+import pytest
+
+from tap_exact.quota import QuotaPlanner
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, build_feed, build_response, fake_entry
+
+FUTURE = 2**50
+
+
+def quota_response(remaining: int, reset: int = FUTURE):
+    return build_response(
+        b"", headers={"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset)}
+    )
+
+
+@pytest.fixture
+def planner():
+    planner = QuotaPlanner({}, reserve=10)
+    planner.update("stream", "1", quota_response(50))
+    return planner
+
+
+def test_unknown_quota_allows_everything():
+    planner = QuotaPlanner({}, reserve=10)
+
+    assert planner.allows_partition("stream", "1", resumable=False, needed=10**6)
+    assert planner.allows_next_page("stream", "1")
+
+
+def test_reset_quota_is_unknown():
+    planner = QuotaPlanner({})
+    planner.update("stream", "1", quota_response(0, reset=1000))
+
+    assert planner.remaining("1") is None
+
+
+def test_partition_must_fit_above_reserve(planner):
+    assert planner.allows_partition("stream", "1", resumable=False, needed=40)
+    assert not planner.allows_partition("stream", "1", resumable=False, needed=41)
+
+
+def test_partition_without_count_uses_last_run(planner):
+    planner.requests["stream"] = {"1": 45}
+
+    assert not planner.allows_partition("stream", "1", resumable=False)
+    assert planner.allows_partition("other", "1", resumable=False)
+
+
+def test_resumable_partition_needs_one_request(planner):
+    assert planner.allows_partition("stream", "1", resumable=True, needed=1000)
+
+
+def test_next_page_stops_at_reserve(planner):
+    assert planner.allows_next_page("stream", "1")
+
+    planner.update("stream", "1", quota_response(10))
+
+    assert not planner.allows_next_page("stream", "1")
+    assert planner.stopped("stream", "1")
+
+
+def test_complete_remembers_requests_of_finished_runs(planner):
+    planner.update("stream", "1", quota_response(49))
+    planner.complete("stream", "1")
+    planner.update("stream", "2", quota_response(10))
+    planner.allows_next_page("stream", "2")
+    planner.complete("stream", "2")
+
+    assert planner.requests == {"stream": {"1": 2}}
+
+
+def test_quota_is_carried_over_in_the_state():
+    tap = TapExact(config=CONFIG, parse_env_config=False)
+    tap.quota_planner.update("transaction_lines", "1", quota_response(50))
+    tap.quota_planner.complete("transaction_lines", "1")
+
+    state = {"bookmarks": {}, "quota": tap.state["quota"]}
+    planner = TapExact(config=CONFIG, state=state, parse_env_config=False).quota_planner
+
+    assert planner.remaining("1") == 50
+    assert planner.estimate("transaction_lines", "1") == 1
+    assert planner.requests == {"transaction_lines": {"1": 1}}
+
+
+def test_only_resumable_streams_stop_at_a_page():
+    tap = TapExact(config=CONFIG, parse_env_config=False)
+    tap.quota_planner.update("sales_entries", "1", quota_response(0))
+    response = build_response(build_feed([fake_entry("1", 0, 0)]))
+
+    assert not tap.streams["transaction_lines"].has_quota_for_next_page(response)
+    assert tap.streams["sales_entries"].has_quota_for_next_page(response)
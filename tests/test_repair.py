@@ -0,0 +1,99 @@
+"""Tests for repairing a range of a stream."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, FakeExact, run_tap
+
+
+class QuotaExact(FakeExact):
+    """Report 1000 requests left today on every response."""
+
+    def send(self, adapter, request, **kwargs):
+        response = super().send(adapter, request, **kwargs)
+        response.headers["X-RateLimit-Reset"] = str(int(time.time() + 3600) * 1000)
+        return response
+
+
+def repair_tap(**repair) -> TapExact:
+    return TapExact(config={**CONFIG, "repair": repair}, parse_env_config=False)
+
+
+def test_timestamp_range_is_split_into_chunks(tap):
+    partitions = tap.streams["transaction_lines"].repair_partitions(["1", "2"], "100", "110", 3)
+    filters = [
+        partition["repair_filter"] for partition in partitions if partition["division"] == "1"
+    ]
+
+    assert filters == [
+        "Timestamp ge 100L and Timestamp lt 104L",
+        "Timestamp ge 104L and Timestamp lt 108L",
+        "Timestamp ge 108L and Timestamp le 110L",
+    ]
+    assert len(partitions) == 6
+
+
+def test_single_timestamp_is_one_chunk(tap):
+    partitions = tap.streams["transaction_lines"].repair_partitions(["1"], "100", "100", 4)
+
+    assert partitions == [
+        {"division": "1", "repair_filter": "Timestamp ge 100L and Timestamp le 100L"}
+    ]
+
+
+def test_modified_range_is_split_into_chunks(tap):
+    partitions = tap.streams["sales_entries"].repair_partitions(
+        ["1"], "2024-01-01T00:00:00Z", "2024-01-03T00:00:00Z", 2
+    )
+
+    assert [partition["repair_filter"] for partition in partitions] == [
+        "Modified ge datetime'2024-01-01T00:00:00' and Modified lt datetime'2024-01-02T00:00:00'",
+        "Modified ge datetime'2024-01-02T00:00:00' and Modified le datetime'2024-01-03T00:00:00'",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("repair", "match"),
+    [
+        ({"stream": "transaction_lines", "start": "200", "end": "100"}, "after end"),
+        ({"stream": "transaction_lines", "start": "2024-01-01", "end": "100"}, "integers"),
+        ({"stream": "transaction_lines", "start": "1", "end": "100", "chunks": 0}, "chunks"),
+        ({"stream": "sales_entries", "start": "2024-02-01", "end": "2024-01-01"}, "after end"),
+        ({"stream": "sales_entries", "start": "yesterday", "end": "2024-01-01"}, "Invalid"),
+        ({"stream": "unknown", "start": "1", "end": "2"}, "unknown stream"),
+    ],
+)
+def test_invalid_repair_is_a_config_error(repair, match):
+    with pytest.raises(ConfigValidationError, match=match):
+        repair_tap(**repair).sync_repair()
+
+
+def test_repair_emits_its_whole_range_past_the_quota_reserve():
+    state = {
+        "bookmarks": {
+            "transaction_lines": {
+                "partitions": [{"context": {"division": "1"}, "replication_key_value": 5}]
+            }
+        }
+    }
+    server = QuotaExact()
+    messages = run_tap(
+        {
+            "divisions": ["1"],
+            "quota_reserve": 1000,
+            "repair": {"stream": "transaction_lines", "start": "1", "end": "100", "chunks": 1},
+        },
+        ("transaction_lines",),
+        server=server,
+        state=state,
+    )
+
+    records = [message["record"]["ID"] for message in messages if message["type"] == "RECORD"]
+    assert records == [f"1-{page}-{row}" for page in range(3) for row in range(3)]
+    assert [message for message in messages if message["type"] == "STATE"] == []
+    assert all("Timestamp+ge+1L" in url for url in server.urls)
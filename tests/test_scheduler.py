@@ -0,0 +1,76 @@
+"""Tests for syncing streams in parallel threads."""
+
+from __future__ import annotations
+
+import inspect
+import threading
+from unittest import mock
+
+import pytest
+from singer_sdk import Tap
+
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, by_stream, run_tap
+
+STREAMS = ("transaction_lines", "gl_classifications", "sales_entries", "sales_invoices")
+
+
+def test_concurrent_sync_matches_sequential_sync():
+    concurrent = run_tap({"max_concurrent_streams": 4}, STREAMS)
+
+    assert by_stream(concurrent) == by_stream(run_tap({}, STREAMS))
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda stream, context: stream._increment_stream_state({"Timestamp": 5}, context=context),
+        lambda stream, context: stream._write_state_message(),
+    ],
+)
+def test_state_is_written_under_the_write_lock(write):
+    tap = TapExact(config=CONFIG, parse_env_config=False)
+    stream = tap.streams["transaction_lines"]
+    written = threading.Event()
+
+    def write_state():
+        write(stream, {"division": "1"})
+        written.set()
+
+    with tap._write_lock:
+        thread = threading.Thread(target=write_state)
+        thread.start()
+        assert not written.wait(0.1)
+    thread.join()
+
+    assert written.is_set()
+
+
+def test_starting_value_is_written_under_the_write_lock():
+    tap = TapExact(config=CONFIG, parse_env_config=False)
+    owned = []
+
+    def write(state, value):
+        owned.append(tap._write_lock._is_owned())
+
+    with mock.patch("singer_sdk.streams.core.write_starting_replication_value", write):
+        tap.streams["transaction_lines"]._write_starting_replication_value({"division": "1"})
+
+    assert owned == [True]
+
+
+def test_sync_all_follows_the_sdk_steps():
+    # TapExact.sync_all replaces the final Tap.sync_all, re-check it when this fails
+    steps = [
+        "self._reset_state_progress_markers()",
+        "self._set_compatible_replication_methods()",
+        "self.write_message(StateMessage(value=self.state))",
+        "stream.sync()",
+        "stream.finalize_state_progress_markers()",
+        "stream.log_sync_costs()",
+    ]
+    source = inspect.getsource(Tap.sync_all)
+    positions = [source.find(step) for step in steps]
+
+    assert -1 not in positions
+    assert positions == sorted(positions)
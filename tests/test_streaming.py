@@ -0,0 +1,60 @@
+"""Tests for streamed responses."""
+
+from __future__ import annotations
+
+import pytest
+
+from tap_exact.cache import CachingAdapter
+from tap_exact.client import InvalidPageError
+from tap_exact.tap import TapExact
+from tests.fakes import CONFIG, build_entry, build_feed, build_response, fake_entry, run_tap
+
+
+@pytest.fixture
+def stream():
+    tap = TapExact(config={**CONFIG, "stream_responses": True}, parse_env_config=False)
+    return tap.streams["transaction_lines"]
+
+
+def test_streamed_page_is_parsed_incrementally(stream):
+    response = build_response(build_feed([fake_entry("1", 0, row) for row in range(3)], "next"))
+
+    stream.validate_response(response)
+
+    assert response.next_link == "next"
+    assert [row["content"]["m:properties"]["d:ID"] for row in stream.parse_response(response)] == [
+        "1-0-0",
+        "1-0-1",
+        "1-0-2",
+    ]
+
+
+def test_truncated_streamed_page_is_rejected(stream):
+    body = build_feed([fake_entry("1", 0, row) for row in range(3)])
+
+    with pytest.raises(InvalidPageError, match="Truncated"):
+        stream.validate_response(build_response(body[:-100]))
+
+
+def test_lost_entries_are_rejected_before_any_record(stream):
+    # the tags are counted, but the parser skips the commented out entry
+    hidden = f"<!-- {build_entry({'ID': 'hidden'})} -->"
+    body = build_feed([fake_entry("1", 0, 0)]).replace(b"<link", hidden.encode() + b"<link", 1)
+
+    with pytest.raises(InvalidPageError, match="expected 2 entries but parsed 1"):
+        stream.validate_response(build_response(body))
+
+
+def test_streamed_records_match_buffered_records():
+    streams = ("transaction_lines", "sales_entries")
+
+    assert run_tap({"stream_responses": True}, streams) == run_tap({}, streams)
+
+
+def test_response_cache_is_not_used_for_streamed_responses(tmp_path):
+    config = {**CONFIG, "stream_responses": True, "response_cache_dir": str(tmp_path)}
+    stream = TapExact(config=config, parse_env_config=False).streams["transaction_lines"]
+
+    adapter = stream.requests_session.get_adapter(stream.url_base)
+
+    assert not isinstance(adapter, CachingAdapter)